@@ -76,9 +76,9 @@ StandardError=journal
 WantedBy=multi-user.target
 SVCEOF
 
-# Part B: Install websockets for CDP
-echo "[5/8] Installing python3-websockets..."
-apt-get install -y -qq python3-websockets 2>/dev/null || pip3 install websockets 2>/dev/null || true
+# Part B: Install websocket-client for CDP
+echo "[5/8] Installing python3-websocket..."
+apt-get install -y -qq python3-websocket 2>/dev/null || pip3 install 'websocket-client>=1.6' 2>/dev/null || true
 
 # Part B: Copy HUD from management VM
 echo "[6/8] Copying HUD page from management VM..."
@@ -97,7 +97,7 @@ HUDEOF
 echo "[7/8] Creating requirements.txt..."
 cat > /opt/jarvis-display-home/requirements.txt << 'REQEOF'
 flask>=3.0
-websockets>=10.4
+websocket-client>=1.6
 REQEOF
 
 # Part B: Create display daemon service
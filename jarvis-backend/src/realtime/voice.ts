@@ -8,8 +8,13 @@
  *
  * Events from Agent (incoming):
  *   voice:audio_start  { agentId }                     - Wake word detected, starting capture
- *   voice:audio_chunk  { agentId, audio, seq }         - Audio chunk (500ms WAV, base64)
+ *   voice:audio_chunk  { agentId, audio, format?, sampleRate?, sampleWidth?, channels?, seq }
+ *                                                      - Audio chunk (binary attachment or
+ *                                                        base64; raw PCM when format is
+ *                                                        pcm_*, otherwise WAV)
  *   voice:audio_end    { agentId }                     - Silence detected, capture ended
+ *   voice:audio        { agentId, audio, ..., final }  - Complete utterance in one message
+ *                                                        (start + chunk + end coalesced)
  *   voice:ping         { agentId }                     - Keep-alive ping
  *
  * Events to Agent (outgoing):
@@ -17,7 +22,7 @@
  *   voice:processing   { }                             - Transcribing audio
  *   voice:transcript   { text }                        - STT result
  *   voice:thinking     { provider }                    - LLM processing
- *   voice:tts_chunk    { index, contentType, audio }   - TTS audio to play (base64)
+ *   voice:tts_chunk    { index, contentType, audio }   - TTS audio to play (binary Buffer)
  *   voice:tts_done     { totalChunks }                 - All TTS chunks sent
  *   voice:error        { error }                       - Error message
  */
@@ -54,6 +59,8 @@ interface VoiceSession {
   agentId: string;
   socketId: string;
   audioChunks: Buffer[];
+  /** Wire format of the chunks: 'wav' (default) or raw PCM parameters. */
+  pcmFormat: { sampleRate: number; sampleWidth: number; channels: number } | null;
   startedAt: number;
   lastChunkAt: number;
   abortController: AbortController;
@@ -137,6 +144,7 @@ export function setupVoiceHandlers(voiceNs: Namespace, eventsNs: Namespace): voi
         agentId,
         socketId: socket.id,
         audioChunks: [],
+        pcmFormat: null,
         startedAt: Date.now(),
         lastChunkAt: Date.now(),
         abortController: new AbortController(),
@@ -149,7 +157,15 @@ export function setupVoiceHandlers(voiceNs: Namespace, eventsNs: Namespace): voi
     });
 
     // Handle incoming audio chunks
-    socket.on('voice:audio_chunk', (payload: { agentId?: string; audio?: string; seq?: number }) => {
+    socket.on('voice:audio_chunk', (payload: {
+      agentId?: string;
+      audio?: string | Buffer;
+      format?: string;
+      sampleRate?: number;
+      sampleWidth?: number;
+      channels?: number;
+      seq?: number;
+    }) => {
       const agentId = payload?.agentId || socket.id;
       const session = voiceSessions.get(agentId);
 
@@ -163,8 +179,21 @@ export function setupVoiceHandlers(voiceNs: Namespace, eventsNs: Namespace): voi
         return;
       }
 
-      // Decode base64 audio and add to session
-      const audioBuffer = Buffer.from(payload.audio, 'base64');
+      // Raw PCM chunks carry their format so we can wrap them in a WAV
+      // header once, at processing time, instead of the agent doing it
+      if (payload.format?.startsWith('pcm')) {
+        session.pcmFormat = {
+          sampleRate: payload.sampleRate || 16000,
+          sampleWidth: payload.sampleWidth || 2,
+          channels: payload.channels || 1,
+        };
+      }
+
+      // Binary attachments arrive as Buffers already; base64 strings
+      // are kept as a fallback for older agents
+      const audioBuffer = Buffer.isBuffer(payload.audio)
+        ? payload.audio
+        : Buffer.from(payload.audio, 'base64');
       session.audioChunks.push(audioBuffer);
       session.lastChunkAt = Date.now();
 
@@ -175,6 +204,57 @@ export function setupVoiceHandlers(voiceNs: Namespace, eventsNs: Namespace): voi
       }
     });
 
+    // Handle a complete utterance in a single message (used by agents
+    // for post-capture sends): equivalent to audio_start + one chunk +
+    // audio_end, but with one packet instead of three
+    socket.on('voice:audio', (payload: {
+      agentId?: string;
+      audio?: string | Buffer;
+      format?: string;
+      sampleRate?: number;
+      sampleWidth?: number;
+      channels?: number;
+      final?: boolean;
+    }) => {
+      const agentId = payload?.agentId || socket.id;
+
+      if (!payload.audio) {
+        console.warn(`[Voice] Empty coalesced audio from ${agentId}`);
+        return;
+      }
+
+      // Replace any in-flight session for this agent
+      const existing = voiceSessions.get(agentId);
+      if (existing) {
+        existing.abortController.abort();
+        voiceSessions.delete(agentId);
+      }
+
+      const audioBuffer = Buffer.isBuffer(payload.audio)
+        ? payload.audio
+        : Buffer.from(payload.audio, 'base64');
+
+      const session: VoiceSession = {
+        agentId,
+        socketId: socket.id,
+        audioChunks: [audioBuffer],
+        pcmFormat: payload.format?.startsWith('pcm')
+          ? {
+              sampleRate: payload.sampleRate || 16000,
+              sampleWidth: payload.sampleWidth || 2,
+              channels: payload.channels || 1,
+            }
+          : null,
+        startedAt: Date.now(),
+        lastChunkAt: Date.now(),
+        abortController: new AbortController(),
+      };
+
+      console.log(`[Voice] Coalesced utterance from agent ${agentId}, processing...`);
+      updateAgentState(socket.id, 'capturing');
+      processVoiceSession(socket, session, eventsNs);
+    });
+
     // Handle end of audio capture (silence detected by agent)
     socket.on('voice:audio_end', (payload: { agentId?: string }) => {
       const agentId = payload?.agentId || socket.id;
@@ -218,6 +298,36 @@ export function setupVoiceHandlers(voiceNs: Namespace, eventsNs: Namespace): voi
 // Voice processing pipeline
 // ---------------------------------------------------------------------------
 
+/**
+ * Prepend a 44-byte WAV (RIFF) header to raw PCM audio.
+ *
+ * Agents send raw PCM to avoid wrapping/copying on their side; Whisper
+ * prefers WAV, so the header is reconstructed here from the session's
+ * format parameters.
+ */
+function pcmToWav(
+  pcm: Buffer,
+  format: { sampleRate: number; sampleWidth: number; channels: number }
+): Buffer {
+  const { sampleRate, sampleWidth, channels } = format;
+  const byteRate = sampleRate * sampleWidth * channels;
+  const header = Buffer.alloc(44);
+  header.write('RIFF', 0, 'ascii');
+  header.writeUInt32LE(36 + pcm.length, 4);
+  header.write('WAVE', 8, 'ascii');
+  header.write('fmt ', 12, 'ascii');
+  header.writeUInt32LE(16, 16); // fmt chunk size
+  header.writeUInt16LE(1, 20); // PCM
+  header.writeUInt16LE(channels, 22);
+  header.writeUInt32LE(sampleRate, 24);
+  header.writeUInt32LE(byteRate, 28);
+  header.writeUInt16LE(sampleWidth * channels, 32); // block align
+  header.writeUInt16LE(sampleWidth * 8, 34); // bits per sample
+  header.write('data', 36, 'ascii');
+  header.writeUInt32LE(pcm.length, 40);
+  return Buffer.concat([header, pcm]);
+}
+
 /**
  * Process a completed voice session:
  * 1. Concatenate audio chunks
@@ -241,8 +351,11 @@ async function processVoiceSession(
     return;
   }
 
-  // Concatenate audio chunks
-  const audioBuffer = Buffer.concat(session.audioChunks);
+  // Concatenate audio chunks, wrapping raw PCM in a WAV header for Whisper
+  let audioBuffer = Buffer.concat(session.audioChunks);
+  if (session.pcmFormat) {
+    audioBuffer = pcmToWav(audioBuffer, session.pcmFormat);
+  }
   const durationMs = Date.now() - session.startedAt;
   console.log(`[Voice] Processing ${audioBuffer.length} bytes (${durationMs}ms) from ${session.agentId}`);
 
@@ -360,10 +473,12 @@ async function processVoiceSession(
 
           // Mark speaking on first TTS chunk
           if (item.index === 0) updateAgentState(socket.id, 'speaking');
+          // Binary attachment: Socket.IO sends Buffers as raw binary
+          // frames, so no base64 expansion (+33%) or agent-side decode
           socket.emit('voice:tts_chunk', {
             index: item.index,
             contentType: emitContentType,
-            audio: emitBuffer.toString('base64'),
+            audio: emitBuffer,
           });
         }
       } catch (err) {
@@ -14,17 +14,21 @@ State machine: camera <-> hud/browser
   browser: mpv minimized, Chromium showing arbitrary URL
 """
 
-import asyncio
-import glob
+import atexit
 import json
 import logging
 import os
 import pwd
 import queue
+import signal
 import subprocess
+import sys
+import threading
 import time
+import urllib.request
 from datetime import datetime, timezone
 
+import websocket
 from flask import Flask, Response, request, jsonify
 
 logging.basicConfig(
@@ -48,57 +52,108 @@ state = {
 
 _chromium_proc = None
 _cached_xauth = None
+_cached_xauth_mtime = None
 
-# SSE state management
-_sse_clients = []
+# SSE state management. Client queues live in a set (O(1) add/discard)
+# guarded by a lock: Flask worker threads register/unregister while
+# transitions broadcast, and list mutation mid-iteration raced.
+_sse_clients = set()
+_sse_lock = threading.Lock()
 _current_hud_state = "idle"
 
 
 def _notify_sse(new_state):
-    """Push a state change to all connected SSE clients."""
+    """Push a state change to all connected SSE clients.
+
+    HUD states are idempotent -- only the latest matters -- so each
+    client queue holds at most one pending entry. If a client's
+    generator has stalled, the stale entry is dropped and replaced
+    (latest-wins) instead of growing an unbounded backlog.
+    """
     global _current_hud_state
     _current_hud_state = new_state
-    dead = []
-    for q in _sse_clients:
+    with _sse_lock:
+        clients = list(_sse_clients)
+    for q in clients:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
         try:
             q.put_nowait({"state": new_state})
-        except Exception:
-            dead.append(q)
-    for q in dead:
-        if q in _sse_clients:
-            _sse_clients.remove(q)
-    logger.info("SSE notify: state=%s, clients=%d", new_state, len(_sse_clients))
+        except queue.Full:
+            pass  # Racing generator consumed and refilled; it has fresh state
+    logger.debug("SSE notify: state=%s, clients=%d", new_state, len(clients))
 
 
 def get_kiosk_xauth():
-    global _cached_xauth
-    if _cached_xauth and os.path.exists(_cached_xauth):
-        return _cached_xauth
+    global _cached_xauth, _cached_xauth_mtime
+    if _cached_xauth:
+        # Single stat re-validates the cache and detects rotation
+        # (new serverauth file after an X restart changes the mtime)
+        try:
+            if os.stat(_cached_xauth).st_mtime == _cached_xauth_mtime:
+                return _cached_xauth
+        except OSError:
+            pass
+        _cached_xauth = None
     try:
         kiosk_uid = pwd.getpwnam("kiosk").pw_uid
     except KeyError:
         logger.error("kiosk user not found in passwd")
         return ""
-    for f in glob.glob("/tmp/serverauth.*"):
-        try:
-            st = os.stat(f)
-            if st.st_uid == kiosk_uid:
-                _cached_xauth = f
-                logger.info("Discovered XAUTHORITY: %s", f)
-                return f
-        except OSError:
-            continue
+    # scandir streams entries and DirEntry.stat() reuses the readdir
+    # data where possible -- no full glob list or fnmatch pass over /tmp
+    try:
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                if not entry.name.startswith("serverauth."):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if st.st_uid == kiosk_uid:
+                    _cached_xauth = entry.path
+                    _cached_xauth_mtime = st.st_mtime
+                    logger.info("Discovered XAUTHORITY: %s", entry.path)
+                    return entry.path
+    except OSError as exc:
+        logger.error("Failed to scan /tmp for XAUTHORITY: %s", exc)
     logger.warning("No XAUTHORITY file found for kiosk user")
     return ""
 
 
+# Cached environment for X11 subprocess calls. The dict is built once,
+# but XAUTHORITY is re-checked through get_kiosk_xauth() on every call:
+# its single-stat cache detects serverauth rotation after an X restart,
+# so stale auth recovers without a daemon restart. Cost is one stat()
+# per X11 invocation instead of the old full /tmp scan + dict rebuild.
+_display_env = None
+
+
 def get_display_env():
-    xauth = get_kiosk_xauth()
-    return {
-        "DISPLAY": ":0",
-        "XAUTHORITY": xauth,
-        "PATH": os.environ.get("PATH", "/usr/bin:/usr/local/bin:/snap/bin"),
-    }
+    global _display_env
+    if _display_env is None:
+        _display_env = {
+            "DISPLAY": ":0",
+            "XAUTHORITY": get_kiosk_xauth(),
+            "PATH": os.environ.get("PATH", "/usr/bin:/usr/local/bin:/snap/bin"),
+        }
+    else:
+        _display_env["XAUTHORITY"] = get_kiosk_xauth()
+    return _display_env
+
+
+def invalidate_display_env():
+    """Drop the cached env so the next X11 call re-discovers XAUTHORITY.
+
+    Called at startup and from error paths where the kiosk xauth file
+    may have rotated (e.g. X server restart).
+    """
+    global _display_env, _cached_xauth
+    _display_env = None
+    _cached_xauth = None
 
 
 def enable_xhost_local():
@@ -133,40 +188,59 @@ def get_mpv_window_ids():
     return []
 
 
+def _run_xdotool_script(script, env):
+    """Run a batch of xdotool commands through a single process.
+
+    ``xdotool -`` reads one command per line from stdin, so N window
+    operations cost one fork+exec and one X11 connection instead of N.
+    """
+    try:
+        return subprocess.run(
+            ["xdotool", "-"],
+            input=script, env=env, capture_output=True, text=True, timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
+        logger.error("xdotool script failed: %s", exc)
+        return None
+
+
 def hide_mpv_windows():
     env = get_display_env()
     wids = get_mpv_window_ids()
-    for wid in wids:
-        try:
-            subprocess.run(
-                ["xdotool", "windowminimize", wid],
-                env=env, capture_output=True, timeout=5,
-            )
-            logger.info("Minimized mpv window %s", wid)
-        except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-            logger.error("Failed to minimize window %s: %s", wid, exc)
+    if not wids:
+        return wids
+    script = "".join("windowminimize %s\n" % wid for wid in wids)
+    result = _run_xdotool_script(script, env)
+    if result is not None and result.returncode == 0:
+        logger.info("Minimized %d mpv window(s): %s", len(wids), wids)
+    else:
+        logger.error(
+            "Failed to minimize mpv windows: %s",
+            result.stderr if result is not None else "xdotool unavailable",
+        )
     return wids
 
 
 def restore_mpv_windows(window_ids):
+    if not window_ids:
+        return
     env = get_display_env()
-    for wid in window_ids:
-        try:
-            subprocess.run(
-                ["xdotool", "windowmap", wid],
-                env=env, capture_output=True, timeout=5,
-            )
-            subprocess.run(
-                ["xdotool", "windowraise", wid],
-                env=env, capture_output=True, timeout=5,
-            )
-            logger.info("Restored mpv window %s", wid)
-        except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-            logger.error("Failed to restore window %s: %s", wid, exc)
+    # windowactivate maps, raises and focuses in a single X11 call,
+    # halving the per-window commands vs windowmap + windowraise
+    script = "".join("windowactivate %s\n" % wid for wid in window_ids)
+    result = _run_xdotool_script(script, env)
+    if result is not None and result.returncode == 0:
+        logger.info("Restored %d mpv window(s): %s", len(window_ids), window_ids)
+    else:
+        logger.error(
+            "Failed to restore mpv windows: %s",
+            result.stderr if result is not None else "xdotool unavailable",
+        )
 
 
 def launch_chromium(url):
-    global _chromium_proc
+    global _chromium_proc, _chromium_wid
+    _chromium_wid = None
     if is_chromium_running():
         logger.info("Chromium already running, navigating instead")
         navigate_sync(url)
@@ -191,10 +265,71 @@ def launch_chromium(url):
     logger.info("Chromium launched with PID %d", _chromium_proc.pid)
 
 
+# Chromium kiosk window id, discovered once per browser process.
+_chromium_wid = None
+
+
+def get_chromium_window_id():
+    global _chromium_wid
+    if _chromium_wid:
+        return _chromium_wid
+    env = get_display_env()
+    try:
+        result = subprocess.run(
+            ["xdotool", "search", "--class", "chromium"],
+            env=env, capture_output=True, text=True, timeout=5,
+        )
+        wids = result.stdout.strip().split("\n") if result.stdout.strip() else []
+        if wids:
+            _chromium_wid = wids[-1]
+    except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
+        logger.error("Failed to get Chromium window ID: %s", exc)
+    return _chromium_wid
+
+
+def ensure_chromium():
+    """Make sure the resident Chromium process is up and CDP-ready.
+
+    Chromium cold start is ~1.5-3s, so the browser is launched once
+    (hidden behind mpv) and kept alive for the daemon's lifetime;
+    transitions only map/unmap its window and Page.navigate.
+    """
+    if is_chromium_running():
+        return True
+    launch_chromium("about:blank")
+    return _wait_for_cdp_ready()
+
+
+def show_chromium():
+    """Map and raise the resident Chromium window.
+
+    The explicit windowmap matters: hide_chromium withdraws the window
+    with windowunmap, and WMs ignore _NET_ACTIVE_WINDOW (what
+    windowactivate sends) for withdrawn windows, so activate alone
+    would leave Chromium unmapped.
+    """
+    wid = get_chromium_window_id()
+    if not wid:
+        logger.warning("No Chromium window to show")
+        return
+    _run_xdotool_script(
+        "windowmap %s\nwindowactivate %s\n" % (wid, wid), get_display_env()
+    )
+
+
+def hide_chromium():
+    """Unmap the resident Chromium window (keeps the process alive)."""
+    wid = get_chromium_window_id()
+    if not wid:
+        return
+    _run_xdotool_script("windowunmap %s\n" % wid, get_display_env())
+
+
 def close_chromium():
     global _chromium_proc
     if _chromium_proc is None:
         return
+    _close_cdp(invalidate_target=True)
     try:
         _chromium_proc.terminate()
         try:
@@ -216,11 +351,51 @@ def is_chromium_running():
     return _chromium_proc.poll() is None
 
 
-async def navigate_to(url):
-    import urllib.request
-    import websockets as ws
-    targets = None
-    for attempt in range(10):
+# Persistent CDP connection: one websocket reused across navigations.
+# Opening a fresh socket per call costs an HTTP /json discovery plus a
+# WS handshake (100-500ms); a cached connection makes navigation a
+# single JSON frame round trip on localhost.
+_cdp_ws = None
+_cdp_msg_id = 0
+_cdp_lock = threading.Lock()
+
+# Cached page target ({"id": ..., "ws_url": ...}). The kiosk runs a
+# single page whose target rarely changes, so /json discovery is only
+# re-run when the cache is empty or connecting with it fails.
+_cached_page_target = None
+
+# Pre-built Page.navigate payload template. Only id and url vary per
+# call, so the dict build + full json.dumps is reduced to escaping the
+# url string and one str.format.
+_CDP_NAV_FMT = '{{"id":{id},"method":"Page.navigate","params":{{"url":{url}}}}}'
+
+
+def _wait_for_cdp_ready(timeout=3.0):
+    """Poll /json/version until the Chromium debug port answers.
+
+    Cheaper liveness probe than fetching the full target list, and far
+    faster than a fixed sleep: on a warm start the port is ready in
+    ~200-400ms. Returns True when ready, False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(
+                "http://localhost:%d/json/version" % CHROMIUM_DEBUG_PORT,
+                timeout=0.1,
+            ) as resp:
+                if resp.status == 200:
+                    return True
+        except Exception:
+            pass
+        time.sleep(0.05)
+    logger.warning("CDP debug port not ready within %.1fs", timeout)
+    return False
+
+
+def _discover_page_target():
+    """Fetch /json and return the page target dict, or None."""
+    for attempt in range(2):
         try:
             with urllib.request.urlopen(
                 "http://localhost:%d/json" % CHROMIUM_DEBUG_PORT, timeout=2
@@ -228,46 +403,103 @@ async def navigate_to(url):
                 targets = json.loads(resp.read())
             break
         except Exception:
-            if attempt < 9:
-                await asyncio.sleep(0.5)
+            if attempt == 0:
+                time.sleep(0.5)
             else:
-                logger.error("CDP not available after 10 attempts")
-                return False
-    if targets is None:
-        return False
+                logger.error("CDP target list not available")
+                return None
     page = next((t for t in targets if t.get("type") == "page"), None)
     if not page:
         logger.error("No page target found in CDP")
-        return False
-    ws_url = page["webSocketDebuggerUrl"]
-    try:
-        async with ws.connect(ws_url) as conn:
-            cmd = json.dumps({
-                "id": 1, "method": "Page.navigate",
-                "params": {"url": url},
-            })
-            await conn.send(cmd)
-            response = await asyncio.wait_for(conn.recv(), timeout=5.0)
-            logger.info("CDP navigate response: %s", response)
-            return True
-    except Exception as exc:
-        logger.error("CDP navigation failed: %s", exc)
-        return False
+        return None
+    return {"id": page.get("id"), "ws_url": page["webSocketDebuggerUrl"]}
+
+
+def _ensure_cdp():
+    """Return the cached CDP websocket, connecting lazily if needed.
+
+    Uses the cached page target first; if connecting with it fails
+    (Chromium restarted, new target id), re-runs /json discovery once.
+    """
+    global _cdp_ws, _cached_page_target
+    if _cdp_ws is not None:
+        return _cdp_ws
+    for fresh in (False, True):
+        if fresh or _cached_page_target is None:
+            _cached_page_target = _discover_page_target()
+        if _cached_page_target is None:
+            return None
+        try:
+            _cdp_ws = websocket.create_connection(
+                _cached_page_target["ws_url"], timeout=5
+            )
+            logger.info("CDP websocket connected: %s", _cached_page_target["ws_url"])
+            return _cdp_ws
+        except Exception as exc:
+            logger.warning(
+                "CDP connect failed (%s target): %s",
+                "fresh" if fresh else "cached", exc,
+            )
+            _cached_page_target = None
+            _cdp_ws = None
+    return None
+
+
+def _close_cdp(invalidate_target=False):
+    """Drop the cached CDP websocket (e.g. when Chromium exits)."""
+    global _cdp_ws, _cached_page_target
+    if _cdp_ws is not None:
+        try:
+            _cdp_ws.close()
+        except Exception:
+            pass
+        _cdp_ws = None
+    if invalidate_target:
+        _cached_page_target = None
 
 
 def navigate_sync(url):
-    try:
-        return asyncio.run(navigate_to(url))
-    except Exception as exc:
-        logger.error("navigate_sync error: %s", exc)
+    """Navigate the Chromium page via the persistent CDP websocket.
+
+    Retries once on a dead socket (Chromium restarted, tab reloaded);
+    the reconnect re-runs /json discovery.
+    """
+    global _cdp_msg_id
+    with _cdp_lock:
+        for attempt in range(2):
+            conn = _ensure_cdp()
+            if conn is None:
+                return False
+            _cdp_msg_id += 1
+            try:
+                # json.dumps(url) handles the string escaping
+                conn.send(_CDP_NAV_FMT.format(id=_cdp_msg_id, url=json.dumps(url)))
+                response = conn.recv()
+                logger.info("CDP navigate response: %s", response)
+                return True
+            except (websocket.WebSocketException, OSError) as exc:
+                _close_cdp(invalidate_target=True)
+                if attempt == 0:
+                    logger.warning("CDP socket dead, reconnecting: %s", exc)
+                else:
+                    logger.error("CDP navigation failed: %s", exc)
         return False
 
 
+# Cached /display/status response: (etag, serialized_bytes). The state
+# dict only mutates on transitions, so between them the JSON response
+# is byte-identical and need not be re-encoded per poll.
+_status_cache = None
+_status_lock = threading.Lock()
+
+
 def _update_state(mode, hud_state=None, chromium_url=None):
+    global _status_cache
     state["mode"] = mode
     state["hud_state"] = hud_state
     state["chromium_url"] = chromium_url
     state["last_changed"] = datetime.now(timezone.utc).isoformat()
+    _status_cache = None
 
 
 def transition_to_hud(hud_state="listening"):
@@ -280,13 +512,12 @@ def transition_to_hud(hud_state="listening"):
     (idle -> listening -> talking) while in HUD mode go purely via SSE.
     """
     if state["mode"] == "camera":
-        # Initial transition: launch Chromium with HUD page
+        # Show the resident Chromium with the HUD page
         wids = hide_mpv_windows()
         state["mpv_window_ids"] = wids
-        launch_chromium(HUD_URL)
-        time.sleep(1.5)
-        if is_chromium_running():
-            navigate_sync(HUD_URL)
+        ensure_chromium()
+        show_chromium()
+        navigate_sync(HUD_URL)
         # Notify SSE after page has loaded
         _notify_sse(hud_state)
     elif state["mode"] == "hud":
@@ -305,10 +536,9 @@ def transition_to_browser(url):
     if state["mode"] == "camera":
         wids = hide_mpv_windows()
         state["mpv_window_ids"] = wids
-        launch_chromium(url)
-        time.sleep(1.5)
-        if is_chromium_running():
-            navigate_sync(url)
+        ensure_chromium()
+        show_chromium()
+        navigate_sync(url)
     elif state["mode"] in ("hud", "browser"):
         navigate_sync(url)
     _update_state("browser", chromium_url=url)
@@ -320,7 +550,9 @@ def transition_to_camera():
     global _current_hud_state
     if state["mode"] == "camera":
         return {"ok": True, "mode": "camera", "note": "already in camera mode"}
-    close_chromium()
+    # Keep Chromium alive (unmapped) so the next hud/browser transition
+    # is a pure windowmap + Page.navigate instead of a cold start
+    hide_chromium()
     wids = state.get("mpv_window_ids", [])
     if not wids:
         wids = get_mpv_window_ids()
@@ -335,8 +567,11 @@ def transition_to_camera():
 @app.get('/display/events')
 def sse_events():
     """Server-Sent Events stream for HUD state changes."""
-    q = queue.Queue()
-    _sse_clients.append(q)
+    # maxsize=1: per-client memory is O(1) and a burst of transitions
+    # collapses to a single delivery of the freshest state
+    q = queue.Queue(maxsize=1)
+    with _sse_lock:
+        _sse_clients.add(q)
 
     def generate():
         # Send current state immediately on connect
@@ -352,8 +587,8 @@ def sse_events():
         except GeneratorExit:
             pass
         finally:
-            if q in _sse_clients:
-                _sse_clients.remove(q)
+            with _sse_lock:
+                _sse_clients.discard(q)
 
     return Response(
         generate(),
@@ -393,10 +628,26 @@ def route_restore():
 
 @app.get("/display/status")
 def route_status():
-    return jsonify(state)
+    global _status_cache
+    with _status_lock:
+        cached = _status_cache
+        if cached is None:
+            cached = _status_cache = (
+                state["last_changed"],
+                json.dumps(state).encode(),
+            )
+    etag, body = cached
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+    return Response(
+        body,
+        mimetype="application/json",
+        headers={"ETag": etag},
+    )
 
 
 def startup_checks():
+    invalidate_display_env()
     xauth = get_kiosk_xauth()
     if xauth:
         logger.info("Startup: XAUTHORITY discovered at %s", xauth)
@@ -405,9 +656,24 @@ def startup_checks():
     enable_xhost_local()
     wids = get_mpv_window_ids()
     logger.info("Startup: Found %d mpv window(s): %s", len(wids), wids)
+    # Pre-warm the resident Chromium so the first camera->hud transition
+    # skips the ~1.5-3s cold start, then hide it behind the cameras
+    if ensure_chromium():
+        hide_chromium()
+
+
+def _handle_term(signum, _frame):
+    # sys.exit() raises SystemExit so the atexit hooks (close_chromium)
+    # run; the default SIGTERM action would kill the process before the
+    # resident Chromium gets a graceful terminate
+    logger.info("Received signal %d, shutting down", signum)
+    sys.exit(0)
 
 
 if __name__ == "__main__":
     startup_checks()
+    atexit.register(close_chromium)
+    signal.signal(signal.SIGTERM, _handle_term)
+    signal.signal(signal.SIGINT, _handle_term)
     logger.info("Starting Jarvis Display Daemon on 0.0.0.0:8765")
     app.run(host="0.0.0.0", port=8765, debug=False, threaded=True)
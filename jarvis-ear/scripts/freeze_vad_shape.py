@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Freeze the Silero VAD input shapes to the streaming case (offline).
+
+The upstream model is exported with a dynamic num_samples dimension,
+which forces shape inference and dispatch checks on every run. Our
+streaming input is always (1, 576) -- 64 context samples plus one
+512-sample frame at 16kHz -- so this pins "input" to that shape and
+"state" to (2, 1, 128), letting ORT constant-fold the Reshape/Slice
+nodes and precompute its memory plan. Writes
+models/silero_vad_fixed.onnx; the VAD loads it automatically when it
+exists (see vad.py). Note the loader prefers silero_vad_int8.onnx over
+the fixed export, so run this before quantize_vad.py -- it picks up
+the fixed model by default and folds both optimizations into the int8
+file.
+
+Usage:
+    python scripts/freeze_vad_shape.py [--model models/silero_vad.onnx]
+
+Requires the onnx package, which is only needed at install time.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import onnx
+from onnxruntime.tools.onnx_model_utils import (
+    fix_output_shapes,
+    make_input_shape_fixed,
+)
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+_DEFAULT_MODEL = _PROJECT_ROOT / "models" / "silero_vad.onnx"
+
+# 64 context samples + 512-sample frame (16kHz streaming window)
+_INPUT_SHAPE = [1, 576]
+_STATE_SHAPE = [2, 1, 128]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Freeze Silero VAD shapes for streaming inference"
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        default=_DEFAULT_MODEL,
+        help="Path to the dynamic-shape silero_vad.onnx (default: models/)",
+    )
+    args = parser.parse_args()
+
+    if not args.model.exists():
+        print(f"Model not found: {args.model}", file=sys.stderr)
+        return 1
+
+    model = onnx.load(str(args.model))
+    make_input_shape_fixed(model.graph, "input", _INPUT_SHAPE)
+    make_input_shape_fixed(model.graph, "state", _STATE_SHAPE)
+    fix_output_shapes(model)
+
+    out_path = args.model.with_name("silero_vad_fixed.onnx")
+    onnx.save(model, str(out_path))
+    print(f"Wrote {out_path} (input={_INPUT_SHAPE}, state={_STATE_SHAPE})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Quantize the Silero VAD model to int8 weights (offline, run once).
+
+Produces models/silero_vad_int8.onnx next to the fp32 model; the VAD
+loads the quantized file automatically when it exists (see vad.py).
+Dynamic weight quantization halves the matmul bandwidth and runs on
+integer dot-product units, at negligible accuracy cost for a model
+whose only output is a speech probability.
+
+The loader prefers int8 over the fixed-shape export, so when
+models/silero_vad_fixed.onnx exists (see freeze_vad_shape.py) this
+quantizes it by default -- quantizing the stock dynamic-shape model
+instead would silently discard the frozen shapes at load time. Run
+freeze_vad_shape.py first to get both optimizations in one file.
+
+Usage:
+    python scripts/quantize_vad.py [--model models/silero_vad_fixed.onnx]
+
+Requires the onnxruntime quantization extras (onnx package) which are
+only needed at install time, not on the daemon's runtime path.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+_MODELS_DIR = _PROJECT_ROOT / "models"
+
+
+def _default_model() -> Path:
+    """Prefer the fixed-shape export so the int8 model keeps its shapes."""
+    fixed = _MODELS_DIR / "silero_vad_fixed.onnx"
+    if fixed.exists():
+        return fixed
+    return _MODELS_DIR / "silero_vad.onnx"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Quantize Silero VAD to int8 weights"
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        default=None,
+        help="Path to the fp32 model (default: models/silero_vad_fixed.onnx "
+        "if present, else models/silero_vad.onnx)",
+    )
+    args = parser.parse_args()
+    if args.model is None:
+        args.model = _default_model()
+
+    if not args.model.exists():
+        print(f"Model not found: {args.model}", file=sys.stderr)
+        return 1
+
+    out_path = args.model.with_name("silero_vad_int8.onnx")
+    quantize_dynamic(
+        str(args.model),
+        str(out_path),
+        weight_type=QuantType.QInt8,
+    )
+    print(
+        f"Wrote {out_path} "
+        f"({args.model.stat().st_size} -> {out_path.stat().st_size} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
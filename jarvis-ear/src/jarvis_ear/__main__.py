@@ -7,8 +7,9 @@ Two-stage audio pipeline:
 2. Every frame goes through Silero VAD
 3. Only speech frames go to WakeWordDetector (saves CPU)
 4. When wake word fires, StateMachine transitions to CAPTURING
-5. During CAPTURING, all frames (speech + silence) are buffered
-6. After 2s silence, captured audio is sent to backend via Socket.IO
+5. During CAPTURING, frames are streamed to the backend via Socket.IO
+   as they arrive (and buffered locally as a fallback)
+6. After 2s silence, audio_end triggers the backend STT pipeline
 """
 
 import logging
@@ -17,6 +18,8 @@ import signal
 import sys
 import time
 
+import numpy as np
+
 from jarvis_ear.audio import AudioCapture
 from jarvis_ear.backend import BackendClient
 from jarvis_ear.config import CHANNELS, SAMPLE_RATE, SAMPLE_WIDTH, VAD_THRESHOLD
@@ -34,6 +37,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("jarvis_ear")
 
+# Frames per inference batch. Crossing the Python->ONNX boundary has a
+# fixed per-call cost that rivals the actual inference for 32ms frames,
+# so VAD/wake-word calls are amortized over 4 frames (128ms of audio) --
+# small enough to stay well inside the wake-latency budget.
+BATCH_FRAMES = 4
+
 
 def main() -> None:
     """Main daemon entry point."""
@@ -80,6 +89,11 @@ def main() -> None:
     shutdown = False
 
     def handle_signal(signum, _frame):
+        # Only set the flag: the handler runs on the main thread, and
+        # touching the ring's Event here (push_sentinel -> Event.set)
+        # can deadlock if the signal lands inside Event.wait() while
+        # the Condition's non-reentrant lock is held. The main loop
+        # polls the flag via its get_frame timeout instead.
         nonlocal shutdown
         logger.info("Received signal %d, shutting down...", signum)
         shutdown = True
@@ -110,64 +124,142 @@ def main() -> None:
     else:
         logger.debug("No startup WAV found at %s", startup_wav)
 
+    batch = []  # int16 numpy frames awaiting batched inference
+    stream_seq = -1  # next chunk seq while streaming a capture, -1 if not
+
+    # Hoist hot lookups to locals: CPython re-resolves every attribute
+    # and enum member per loop pass otherwise (~31 passes/sec)
+    get_frame = capture.get_frame
+    vad_batch = vad.is_speech_batch
+    ww_detect_batch = wakeword.detect_batch
+    ww_note_silence = wakeword.note_silence
+    sm = state_machine
+    sm_on_frame = state_machine.on_frame
+    send_chunk = backend.send_audio_chunk
+    IDLE = State.IDLE
+    CAPTURING = State.CAPTURING
+    CONVERSATION = State.CONVERSATION
+    monotonic = time.monotonic
+
     try:
         while not shutdown:
-            frame = capture.get_frame(timeout=0.1)
+            # Frames arrive every 32ms, so the timeout only fires if
+            # capture stalls -- it exists to bound how long a SIGTERM
+            # can sit unnoticed while we are blocked here (the handler
+            # may not touch the ring's Event, see handle_signal).
+            frame = get_frame(timeout=0.5)
             if frame is None:
                 continue
 
-            total_frames += 1
-            is_speech = vad.is_speech(frame)
-            if is_speech:
-                speech_frames += 1
+            # Accumulate a small batch so VAD/wake-word cross the
+            # Python->ONNX boundary once per BATCH_FRAMES frames.
+            batch.append(frame)
+            if len(batch) < BATCH_FRAMES:
+                continue
+            frames, batch = batch, []
+
+            speech_flags = vad_batch(frames)
+            n_speech = sum(speech_flags)
+            total_frames += len(frames)
+            speech_frames += n_speech
 
-            if state_machine.state == State.IDLE:
+            if sm.state is IDLE:
                 # Two-stage pipeline: only run wake word on speech frames
-                if is_speech:
-                    detected = wakeword.detect(frame)
+                if n_speech:
+                    speech_only = [
+                        f for f, s in zip(frames, speech_flags) if s
+                    ]
+                    detected = ww_detect_batch(speech_only)
                     if detected:
                         wake_detections += 1
-                        logger.info(
+                        logger.debug(
                             "Wake word detected! Draining pre-roll buffer..."
                         )
                         preroll = capture.drain_preroll()
                         state_machine.on_wake_word(preroll)
+                        # Stream frames as they arrive so backend
+                        # buffering overlaps with the capture; falls
+                        # back to one post-capture blob if offline
+                        if backend.send_audio_start():
+                            if preroll:
+                                backend.send_audio_chunk(preroll, 0)
+                            stream_seq = 1
+                        else:
+                            stream_seq = -1
                         display.on_wake_word()
                         speaker.play_chime()
                         wakeword.reset()  # Discard frames captured during chime
                         vad.reset()
+                else:
+                    # Fully silent batch: let the detector clear its
+                    # rolling buffers after a sustained streak
+                    ww_note_silence(len(frames))
 
-            elif state_machine.state == State.CAPTURING:
-                captured_audio = state_machine.on_frame(frame, is_speech)
-                if captured_audio is not None:
-                    # Capture complete -- audio is ready for processing
-                    duration_s = len(captured_audio) / (
-                        SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS
+            elif sm.state is CAPTURING:
+                if stream_seq >= 0:
+                    # Coalesce the whole inference batch into one emit:
+                    # one Socket.IO envelope + WebSocket frame per 128ms
+                    # instead of four, at no extra latency (the frames
+                    # were already batched for VAD)
+                    chunk = (
+                        frames[0]
+                        if len(frames) == 1
+                        else np.concatenate(frames)
                     )
-                    captures_completed += 1
-                    logger.info(
-                        "Capture #%d complete: %.1fs of audio (%d bytes)",
-                        captures_completed,
-                        duration_s,
-                        len(captured_audio),
-                    )
-                    backend.send_audio(captured_audio)
-                    vad.reset()
+                    send_chunk(chunk.tobytes(), stream_seq)
+                    stream_seq += 1
+                for frame, is_speech in zip(frames, speech_flags):
+                    captured_audio = sm_on_frame(frame, is_speech)
+                    if captured_audio is not None:
+                        # Capture complete -- audio is ready for processing
+                        duration_s = len(captured_audio) / (
+                            SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS
+                        )
+                        captures_completed += 1
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Capture #%d complete: %.1fs of audio (%d bytes)",
+                                captures_completed,
+                                duration_s,
+                                len(captured_audio),
+                            )
+                        if stream_seq >= 0:
+                            backend.send_audio_end()
+                            stream_seq = -1
+                        else:
+                            backend.send_audio(captured_audio)
+                        vad.reset()
+                        break
 
-            elif state_machine.state == State.CONVERSATION:
+            elif sm.state is CONVERSATION:
                 # 15-second follow-up window after TTS playback
-                if state_machine.check_conversation_timeout():
+                if sm.check_conversation_timeout():
                     # Window expired, back to IDLE
                     wakeword.reset()
                     vad.reset()
-                elif is_speech:
+                elif n_speech:
                     # Follow-up speech detected -- start capturing without wake word
-                    state_machine.on_conversation_speech()
+                    sm.on_conversation_speech()
+                    stream_seq = 0 if backend.send_audio_start() else -1
                     conversation_followups += 1
-                    logger.info("Follow-up question detected in conversation mode")
+                    logger.debug("Follow-up question detected in conversation mode")
+                    # Feed this batch into the fresh capture -- it holds
+                    # the follow-up's opening syllable (up to 128ms), and
+                    # unlike the wake path there is no pre-roll to
+                    # recover it from
+                    if stream_seq >= 0:
+                        chunk = (
+                            frames[0]
+                            if len(frames) == 1
+                            else np.concatenate(frames)
+                        )
+                        send_chunk(chunk.tobytes(), stream_seq)
+                        stream_seq += 1
+                    for frame, is_speech in zip(frames, speech_flags):
+                        sm_on_frame(frame, is_speech)
 
             # Periodic stats
-            now = time.monotonic()
+            now = monotonic()
             if now - last_stats_time >= STATS_INTERVAL:
                 elapsed = now - last_stats_time
                 fps = total_frames / elapsed if elapsed > 0 else 0
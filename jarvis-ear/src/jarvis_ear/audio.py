@@ -1,20 +1,22 @@
 """Continuous ALSA audio capture in a background thread.
 
 Reads 32ms frames (512 samples at 16kHz, 16-bit mono) from the default
-ALSA device (plug -> dsnoop -> hw:sofhdadsp,7) and deposits them into:
-1. A ring buffer (for pre-roll before wake word)
-2. A queue.Queue (for downstream VAD/wake word processing)
+ALSA device (plug -> dsnoop -> hw:sofhdadsp,7) and publishes them into a
+single SPSC ring buffer that serves both pre-roll readback (before wake
+word) and ordered frame delivery (downstream VAD/wake word processing).
 
 Note: The dsnoop slave has period_size=256, so ALSA reads return 256-sample
 chunks. This module accumulates reads into 512-sample frames (1024 bytes)
 to match Silero VAD's expected input size.
 """
 
+import errno
 import logging
-import queue
+import select
 import threading
 
 import alsaaudio
+import numpy as np
 
 from jarvis_ear import config
 from jarvis_ear.ring_buffer import RingBuffer
@@ -24,6 +26,10 @@ logger = logging.getLogger(__name__)
 # Target frame size in bytes: 512 samples * 2 bytes/sample (16-bit) * 1 channel
 _TARGET_FRAME_BYTES = config.FRAME_SIZE * config.SAMPLE_WIDTH * config.CHANNELS
 
+# Ring capacity: 128 frames = ~4.1s of consumer backlog before the
+# producer starts overwriting the oldest frames
+_RING_FRAMES = 128
+
 
 class AudioCapture:
     """Continuous ALSA audio capture in a background thread.
@@ -32,16 +38,18 @@ class AudioCapture:
     continuously. Each output frame is 512 samples (32ms at 16kHz, 16-bit
     mono = 1024 bytes). ALSA reads may return smaller chunks due to the
     dsnoop period size, so reads are accumulated to form complete frames.
-    Frames are deposited into both a ring buffer (pre-roll) and a queue
-    (downstream processing).
+    Frames are published into one SPSC ring buffer that serves both
+    pre-roll readback and downstream processing.
     """
 
     def __init__(self) -> None:
-        """Initialize ALSA capture device, ring buffer, and frame queue."""
-        # Open ALSA capture device in blocking mode
+        """Initialize ALSA capture device and the shared frame ring."""
+        # Open ALSA capture device in non-blocking mode: the capture
+        # loop waits for readable periods via epoll (which releases the
+        # GIL in the kernel wait) instead of blocking inside read()
         self._pcm = alsaaudio.PCM(
             type=alsaaudio.PCM_CAPTURE,
-            mode=alsaaudio.PCM_NORMAL,
+            mode=alsaaudio.PCM_NONBLOCK,
             device=config.ALSA_DEVICE,
             rate=config.SAMPLE_RATE,
             channels=config.CHANNELS,
@@ -50,12 +58,14 @@ class AudioCapture:
             periods=config.ALSA_PERIODS,
         )
 
-        # Pre-roll ring buffer: stores last 500ms of audio (15 frames)
-        self._ring_buffer = RingBuffer(max_frames=config.PREROLL_FRAMES)
-
-        # Frame delivery queue: downstream consumers call get_frame()
-        # maxsize=100 -> 100 * 32ms = ~3.2 seconds buffer
-        self._queue: queue.Queue[bytes] = queue.Queue(maxsize=100)
+        # Shared SPSC ring: one per-frame publish covers both the
+        # pre-roll window (last 500ms / 15 frames) and the delivery
+        # path that downstream consumers pop via get_frame()
+        self._ring = RingBuffer(
+            capacity_frames=_RING_FRAMES,
+            preroll_frames=config.PREROLL_FRAMES,
+            frame_bytes=_TARGET_FRAME_BYTES,
+        )
 
         # Thread control
         self._stop_event = threading.Event()
@@ -96,97 +106,139 @@ class AudioCapture:
         self._started = False
         logger.info("Audio capture stopped")
 
-    def get_frame(self, timeout: float = 0.1) -> bytes | None:
-        """Get next audio frame from the queue.
+    def get_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        """Get next audio frame from the ring.
+
+        Blocks until a frame arrives by default -- frames are produced
+        every 32ms, so a blocking wait avoids spurious timeout wakeups.
+        Returns None on timeout or when a shutdown sentinel (see
+        push_sentinel) is delivered.
 
         Args:
-            timeout: Maximum seconds to wait for a frame.
+            timeout: Maximum seconds to wait for a frame, or None to
+                block indefinitely.
 
         Returns:
-            Raw PCM frame as bytes, or None if timeout expired.
+            Frame as an int16 numpy array (512 samples), or None
+            (timeout / sentinel). The ring's backing storage is int16,
+            so the frame arrives as an ndarray copy with no
+            bytes -> np.frombuffer round trip.
         """
-        try:
-            return self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self._ring.get_frame(timeout=timeout)
+
+    def push_sentinel(self) -> None:
+        """Push a sentinel to wake a consumer blocked in get_frame().
+
+        Used by signal handlers to unblock the main loop on shutdown.
+        """
+        self._ring.push_sentinel()
 
     def drain_preroll(self) -> bytes:
-        """Drain the pre-roll ring buffer.
+        """Read the pre-roll window from the ring.
 
         Returns:
-            All buffered pre-roll frames concatenated as a single bytes object.
+            The most recent pre-roll frames concatenated as a single
+            bytes object (empty if nothing new since the last drain).
         """
-        return self._ring_buffer.drain()
+        return self._ring.drain_preroll()
 
     def _capture_loop(self) -> None:
         """Main capture loop running in background thread.
 
-        Reads from ALSA in blocking mode and accumulates data into
-        512-sample frames (1024 bytes). The dsnoop period_size is 256,
-        so typically 2 ALSA reads are needed per output frame.
-
-        Each complete frame:
-        1. Is appended to ring buffer (pre-roll)
-        2. Is put in queue for downstream processing
+        Waits for readable periods with epoll on the PCM's poll
+        descriptors, then drains the device with non-blocking reads and
+        assembles the data into 512-sample frames (1024 bytes) via a
+        fixed buffer and write cursor. The dsnoop period_size is 256,
+        so typically 2 ALSA reads are needed per output frame; if
+        several periods accumulate they are drained in one wakeup.
 
-        If queue is full (downstream too slow), logs a warning and drops
-        the frame from the queue but still updates the ring buffer.
+        Each complete frame is published once into the shared SPSC ring,
+        which covers both pre-roll and downstream delivery. If the
+        consumer lags by a full ring, the oldest frames are overwritten
+        (the ring logs and counts the drops on resync).
 
         On ALSA errors (xrun/overrun), logs a warning and continues.
         """
         logger.info("Capture loop started (target frame: %d bytes)", _TARGET_FRAME_BYTES)
         overrun_count = 0
-        drop_count = 0
-        accumulator = bytearray()
 
-        while not self._stop_event.is_set():
+        # Fixed-size assembly buffer with a write cursor.  ALSA periods
+        # are smaller than one frame, so reads are copied into place via
+        # memoryview slices -- no growing bytearray, no O(n) slice-delete
+        # memmove every 32ms.
+        frame_buf = bytearray(_TARGET_FRAME_BYTES)
+        frame_view = memoryview(frame_buf)
+        pos = 0
+
+        # Hoist hot lookups to locals (~31 wakeups/sec).  The heavy
+        # lifting already happens in C: pyalsaaudio's read() runs
+        # snd_pcm_readi with the GIL released, so the Python side of
+        # this loop is just buffer assembly and one ring publish.
+        pcm_read = self._pcm.read
+        ring_push = self._ring.push_frame
+        stop_is_set = self._stop_event.is_set
+
+        # Wait for data with epoll on the PCM's poll descriptors: the
+        # kernel wait runs without the GIL, and a wakeup with several
+        # accumulated periods is drained in one pass below
+        poller = select.epoll()
+        for fd, eventmask in self._pcm.polldescriptors():
+            poller.register(fd, eventmask)
+
+        while not stop_is_set():
             try:
-                length, data = self._pcm.read()
-            except alsaaudio.ALSAAudioError as exc:
-                logger.error("ALSA read error: %s", exc)
-                if self._stop_event.is_set():
-                    break
-                continue
-
-            if length < 0:
-                # Negative length indicates an error (e.g., -32 = EPIPE overrun)
-                overrun_count += 1
-                if overrun_count % 100 == 1:
-                    logger.warning(
-                        "ALSA overrun (error code %d), total overruns: %d",
-                        length,
-                        overrun_count,
-                    )
+                if not poller.poll(0.1):
+                    continue  # Timeout: recheck stop flag
+            except InterruptedError:
                 continue
 
-            if length == 0:
-                # Zero-length read: underrun or no data
-                continue
-
-            # Accumulate raw bytes until we have a complete frame
-            accumulator.extend(data)
-
-            # Emit complete frames (may emit multiple if ALSA returned a large chunk)
-            while len(accumulator) >= _TARGET_FRAME_BYTES:
-                frame = bytes(accumulator[:_TARGET_FRAME_BYTES])
-                del accumulator[:_TARGET_FRAME_BYTES]
-
-                # Always update ring buffer (pre-roll must stay current)
-                self._ring_buffer.append(frame)
-
-                # Deliver to downstream queue
+            # Drain every complete period available right now
+            while True:
                 try:
-                    self._queue.put_nowait(frame)
-                except queue.Full:
-                    drop_count += 1
-                    if drop_count % 100 == 1:
+                    length, data = pcm_read()
+                except alsaaudio.ALSAAudioError as exc:
+                    logger.error("ALSA read error: %s", exc)
+                    break
+
+                if length < 0:
+                    if length == -errno.EAGAIN:
+                        break  # Device drained, back to epoll
+                    # Other negative = error (e.g., -32 = EPIPE overrun)
+                    overrun_count += 1
+                    if overrun_count % 100 == 1:
                         logger.warning(
-                            "Frame queue full, dropped frame (total drops: %d)",
-                            drop_count,
+                            "ALSA overrun (error code %d), total overruns: %d",
+                            length,
+                            overrun_count,
                         )
+                    break
+
+                if length == 0:
+                    # No complete period ready
+                    break
 
+                # Copy the read into the assembly buffer, emitting a frame
+                # each time the cursor wraps (an ALSA read may span frames)
+                data_view = memoryview(data)
+                data_len = len(data)
+                offset = 0
+                while offset < data_len:
+                    take = min(_TARGET_FRAME_BYTES - pos, data_len - offset)
+                    frame_view[pos:pos + take] = data_view[offset:offset + take]
+                    pos += take
+                    offset += take
+                    if pos < _TARGET_FRAME_BYTES:
+                        break
+                    pos = 0
+
+                    # Publish straight from the assembly buffer: the
+                    # ring copies into its contiguous backing before
+                    # returning, so no per-frame bytes object is built
+                    ring_push(frame_view)
+
+        poller.close()
         logger.info(
             "Capture loop exited: overruns=%d drops=%d",
             overrun_count,
-            drop_count,
+            self._ring.drop_count,
         )
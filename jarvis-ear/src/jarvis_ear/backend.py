@@ -1,9 +1,12 @@
 """Socket.IO client for Jarvis backend /voice namespace.
 
-Handles JWT authentication, Socket.IO connection management, PCM-to-WAV
-conversion, and the voice protocol (audio_start/chunk/end).  Designed to
-be called from the synchronous main loop -- python-socketio's sync Client
-runs I/O in background threads.
+Handles JWT authentication, Socket.IO connection management, and the
+voice protocol (audio_start/chunk/end).  Designed to be called from the
+synchronous main loop: all I/O runs on a single asyncio event loop in
+one dedicated thread (socketio.AsyncClient), so emits are scheduled onto
+that loop instead of hopping through the sync client's internal
+lock-protected queues, and the health monitor is a task on the same
+loop rather than its own thread.
 
 Phase 35 -- backend integration with reconnection resilience, health
 monitoring, token refresh, and non-blocking startup.
@@ -11,16 +14,16 @@ monitoring, token refresh, and non-blocking startup.
 
 from __future__ import annotations
 
-import base64
-import io
+import asyncio
 import logging
 import threading
 import time
-import wave
 from typing import TYPE_CHECKING
 
+import orjson
 import requests
 import socketio
+from requests.adapters import HTTPAdapter, Retry
 
 if TYPE_CHECKING:
     from jarvis_ear.display import DisplayClient
@@ -39,23 +42,59 @@ from jarvis_ear.config import (
 
 logger = logging.getLogger("jarvis_ear.backend")
 
+# Checked at call time (module import runs before __main__ configures
+# logging, so a cached value would freeze the WARNING default): one
+# isEnabledFor is still far cheaper than letting logger.debug build
+# call frames and take the handler lock on the per-chunk emit path
+_DEBUG_LEVEL = logging.DEBUG
+
 # Token refresh interval (6 days; token valid for 7 days)
 _TOKEN_REFRESH_S = 6 * 24 * 3600
 
+# Persistent HTTP session for token refresh.  A bare requests.post()
+# builds a new Session (and TCP/TLS handshake) per call, which matters
+# during reconnect storms when _on_connect refreshes the token; keeping
+# one pooled session reuses the connection and adds retry backoff.
+_http = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+_http.mount("http://", _http_adapter)
+_http.mount("https://", _http_adapter)
+
+# Wire format tag for voice:audio_chunk payloads.  Raw PCM skips the
+# WAV wrapping (BytesIO + wave.Wave_write + a full extra copy) that used
+# to sit on the hot path; the backend prepends the 44-byte header itself
+# before handing audio to Whisper.
+_AUDIO_FORMAT = "pcm_s16le_16k_mono"
+
+# PCM data rate folded once at import (16kHz * 2 bytes * 1 channel)
+_BYTES_PER_SECOND = SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS
 
-def pcm_to_wav(pcm_bytes: bytes) -> bytes:
-    """Wrap raw PCM bytes in a valid WAV header.
+# audio_start / audio_end / ping all carry the same static payload;
+# build it once instead of per emit
+_AGENT_MSG = {"agentId": AGENT_ID}
 
-    Uses the audio format constants from config: 16 kHz, 16-bit, mono.
-    Returns a complete WAV file as bytes.
+
+class _OrjsonCodec:
+    """json-module shim so python-socketio encodes envelopes with orjson.
+
+    The Socket.IO packet encoder runs per emit (~8/sec while streaming
+    a capture); orjson serializes the small event dicts several times
+    faster than stdlib json. The encoder passes json.dumps kwargs like
+    separators, which orjson neither needs nor accepts, so they are
+    swallowed here.
     """
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(SAMPLE_WIDTH)
-        wf.setframerate(SAMPLE_RATE)
-        wf.writeframes(pcm_bytes)
-    return buf.getvalue()
+
+    @staticmethod
+    def dumps(obj, **_kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data, **_kwargs):
+        return orjson.loads(data)
 
 
 class BackendClient:
@@ -87,17 +126,24 @@ class BackendClient:
         self._last_disconnect_at: float = 0.0
         self._last_pong_time: float = 0.0
 
-        # Health monitor shutdown control
-        self._shutdown_event = threading.Event()
-        self._health_thread: threading.Thread | None = None
+        # Single I/O event loop running in one dedicated thread; emits
+        # from the main loop are scheduled onto it thread-safely
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            name="backend-io",
+            daemon=True,
+        )
+        self._health_task: asyncio.Task | None = None
 
-        self._sio = socketio.Client(
+        self._sio = socketio.AsyncClient(
             reconnection=True,
             reconnection_delay=1,
             reconnection_delay_max=30,
             reconnection_attempts=0,  # infinite
             randomization_factor=0.5,
             logger=False,
+            json=_OrjsonCodec,
         )
 
         # Register event handlers on /voice namespace
@@ -123,19 +169,14 @@ class BackendClient:
         return self._connected
 
     def start(self) -> None:
-        """Non-blocking startup: attempt connection in a background thread.
+        """Non-blocking startup: connect on the I/O loop in the background.
 
         The main audio loop is never blocked on startup.  If the initial
         connection fails, python-socketio's built-in reconnection handles
         retries with exponential backoff.
         """
-        t = threading.Thread(
-            target=self._background_connect,
-            name="backend-connect",
-            daemon=True,
-        )
-        t.start()
-        self._start_health_monitor()
+        self._ensure_loop()
+        self._submit(self._startup())
 
     def connect(self) -> bool:
         """Connect to backend /voice namespace (synchronous).
@@ -143,17 +184,12 @@ class BackendClient:
         Returns True on success, False on failure.  Never raises.
         Kept for backward compatibility; prefer start() for non-blocking.
         """
+        self._ensure_loop()
         try:
-            token = self._get_token()
-            self._sio.connect(
-                BACKEND_URL,
-                namespaces=["/voice"],
-                auth={"token": token},
-                transports=["websocket"],
-                wait=True,
-                wait_timeout=10,
+            fut = asyncio.run_coroutine_threadsafe(
+                self._async_connect(), self._loop
             )
-            return True
+            return fut.result(timeout=15)
         except Exception as exc:
             logger.warning("Failed to connect to backend: %s", exc)
             return False
@@ -161,58 +197,97 @@ class BackendClient:
     def disconnect(self) -> None:
         """Disconnect from backend.  Safe to call even when not connected.
 
-        Stops the health monitor thread, then disconnects Socket.IO.
+        Cancels the health monitor task, disconnects Socket.IO, then
+        stops the I/O loop thread.
+        """
+        if self._loop_thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._shutdown(), self._loop
+                ).result(timeout=5)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+
+    def send_audio_start(self) -> bool:
+        """Open a streaming voice session (emits voice:audio_start).
+
+        Returns:
+            True if the session was opened, False if not connected (the
+            caller should fall back to send_audio after capture).
         """
-        # Signal health monitor to stop
-        self._shutdown_event.set()
+        if not self._connected:
+            return False
+        self._emit("voice:audio_start", _AGENT_MSG)
+        return True
+
+    def send_audio_chunk(self, frame: bytes, seq: int) -> None:
+        """Stream one raw PCM chunk (emits voice:audio_chunk).
+
+        Called per frame during capture so backend buffering overlaps
+        with the recording instead of waiting for the last ALSA read.
+        Passing bytes lets python-socketio ship the audio as an
+        Engine.IO binary attachment -- no base64 pass, no 33% payload
+        inflation -- and the format fields let the backend reconstruct
+        the WAV header itself.
+        """
+        if not self._connected:
+            return
+        self._emit(
+            "voice:audio_chunk",
+            {
+                "agentId": AGENT_ID,
+                "audio": frame,
+                "format": _AUDIO_FORMAT,
+                "sampleRate": SAMPLE_RATE,
+                "sampleWidth": SAMPLE_WIDTH,
+                "channels": CHANNELS,
+                "seq": seq,
+            },
+        )
 
-        # Wait for health monitor thread to finish
-        if self._health_thread is not None and self._health_thread.is_alive():
-            self._health_thread.join(timeout=5)
+    def send_audio_end(self) -> None:
+        """Close the streaming voice session (emits voice:audio_end).
 
-        try:
-            self._sio.disconnect()
-        except Exception:
-            pass
+        Triggers the STT -> LLM -> TTS pipeline on the backend.
+        """
+        if not self._connected:
+            return
+        self._emit("voice:audio_end", _AGENT_MSG)
 
     def send_audio(self, captured_audio: bytes) -> None:
-        """Send captured audio through the voice protocol.
+        """Send a complete capture through the voice protocol in one go.
 
-        Emits audio_start, a single audio_chunk (PCM wrapped in WAV,
-        base64-encoded), and audio_end on the /voice namespace.
+        Fallback path for captures that could not stream (backend was
+        not connected when the wake word fired): one coalesced
+        voice:audio emit carries the whole utterance with final=True,
+        standing in for the audio_start / audio_chunk / audio_end
+        triple -- one packetization pass instead of three.
         """
         if not self._connected:
             logger.warning("Not connected to backend, dropping audio")
             return
 
-        agent_id = AGENT_ID
-
-        # 1. Signal start of voice session
-        self._sio.emit(
-            "voice:audio_start", {"agentId": agent_id}, namespace="/voice"
-        )
-
-        # 2. Convert PCM to WAV, base64-encode, send as single chunk
-        wav_bytes = pcm_to_wav(captured_audio)
-        audio_b64 = base64.b64encode(wav_bytes).decode("ascii")
-        self._sio.emit(
-            "voice:audio_chunk",
-            {"agentId": agent_id, "audio": audio_b64, "seq": 0},
-            namespace="/voice",
+        self._emit(
+            "voice:audio",
+            {
+                "agentId": AGENT_ID,
+                "audio": captured_audio,
+                "format": _AUDIO_FORMAT,
+                "sampleRate": SAMPLE_RATE,
+                "sampleWidth": SAMPLE_WIDTH,
+                "channels": CHANNELS,
+                "seq": 0,
+                "final": True,
+            },
         )
 
-        # 3. Signal end -- triggers STT -> LLM -> TTS pipeline on backend
-        self._sio.emit(
-            "voice:audio_end", {"agentId": agent_id}, namespace="/voice"
-        )
-
-        duration_s = len(captured_audio) / (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS)
+        duration_s = len(captured_audio) / _BYTES_PER_SECOND
         logger.info(
-            "Sent %.1fs audio to backend (%d bytes raw, %d bytes WAV, %d bytes b64)",
+            "Sent %.1fs audio to backend (%d bytes PCM, binary)",
             duration_s,
             len(captured_audio),
-            len(wav_bytes),
-            len(audio_b64),
         )
 
     def status(self) -> dict:
@@ -230,54 +305,95 @@ class BackendClient:
         }
 
     # ------------------------------------------------------------------
-    # Background startup
+    # I/O event loop
     # ------------------------------------------------------------------
 
-    def _background_connect(self) -> None:
-        """Attempt initial connection in a background thread."""
+    def _run_loop(self) -> None:
+        """Thread target: run the I/O event loop until stopped."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _ensure_loop(self) -> None:
+        """Start the I/O loop thread if it is not running yet."""
+        if not self._loop_thread.is_alive():
+            self._loop_thread.start()
+
+    def _submit(self, coro) -> None:
+        """Schedule a coroutine on the I/O loop (fire-and-forget)."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        fut.add_done_callback(self._log_submit_error)
+
+    def _emit(self, event: str, payload: dict) -> None:
+        """Schedule an emit on the /voice namespace from any thread."""
+        self._submit(self._sio.emit(event, payload, namespace="/voice"))
+
+    @staticmethod
+    def _log_submit_error(fut) -> None:
+        exc = fut.exception()
+        if exc is not None:
+            logger.warning("Backend I/O task failed: %s", exc)
+
+    async def _startup(self) -> None:
+        """Start the health monitor task and attempt initial connection."""
+        self._health_task = asyncio.ensure_future(self._health_loop())
         try:
-            token = self._get_token()
-            self._sio.connect(
-                BACKEND_URL,
-                namespaces=["/voice"],
-                auth={"token": token},
-                transports=["websocket"],
-                wait=True,
-                wait_timeout=10,
-            )
+            await self._async_connect()
         except Exception as exc:
             logger.warning(
                 "Backend not available, will reconnect automatically: %s", exc
             )
 
+    async def _async_connect(self) -> bool:
+        """Connect to the /voice namespace on the I/O loop.
+
+        Token acquisition is blocking HTTP, so it runs in the default
+        executor rather than on the loop itself.
+        """
+        token = await self._loop.run_in_executor(None, self._get_token)
+        await self._sio.connect(
+            BACKEND_URL,
+            namespaces=["/voice"],
+            auth={"token": token},
+            transports=["websocket"],
+            wait=True,
+            wait_timeout=10,
+        )
+        return True
+
+    async def _shutdown(self) -> None:
+        """Cancel the health task and disconnect Socket.IO."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        try:
+            await self._sio.disconnect()
+        except Exception:
+            pass
+
     # ------------------------------------------------------------------
     # Health monitoring
     # ------------------------------------------------------------------
 
-    def _start_health_monitor(self) -> None:
-        """Start a background daemon thread that sends keepalive pings."""
-        self._health_thread = threading.Thread(
-            target=self._health_loop,
-            name="backend-health",
-            daemon=True,
-        )
-        self._health_thread.start()
+    async def _health_loop(self) -> None:
+        """Periodically send voice:ping and check for voice:pong replies.
 
-    def _health_loop(self) -> None:
-        """Periodically send voice:ping and check for voice:pong replies."""
-        while not self._shutdown_event.wait(timeout=BACKEND_PING_INTERVAL_S):
+        Runs as a task on the I/O loop (no dedicated thread); stopped by
+        cancellation from _shutdown.
+        """
+        while True:
+            await asyncio.sleep(BACKEND_PING_INTERVAL_S)
             if not self._connected:
                 continue
 
             try:
-                self._sio.emit(
-                    "voice:ping",
-                    {"agentId": AGENT_ID},
-                    namespace="/voice",
+                await self._sio.emit(
+                    "voice:ping", _AGENT_MSG, namespace="/voice"
                 )
-                logger.debug("Ping sent")
+                if logger.isEnabledFor(_DEBUG_LEVEL):
+                    logger.debug("Ping sent")
             except Exception as exc:
-                logger.debug("Ping failed: %s", exc)
+                if logger.isEnabledFor(_DEBUG_LEVEL):
+                    logger.debug("Ping failed: %s", exc)
 
             # Check for stale connection (no pong within timeout)
             if self._last_pong_time > 0:
@@ -292,20 +408,33 @@ class BackendClient:
     def _on_pong(self, data: dict | None = None) -> None:
         """Handle voice:pong keepalive reply from backend."""
         self._last_pong_time = time.time()
-        logger.debug("Pong received")
+        if logger.isEnabledFor(_DEBUG_LEVEL):
+            logger.debug("Pong received")
 
     # ------------------------------------------------------------------
     # Token management
     # ------------------------------------------------------------------
 
     def _get_token(self) -> str:
-        """Get a valid JWT token, refreshing if needed."""
+        """Get a valid JWT token, refreshing if needed.
+
+        Lock-free fast path: attribute reads are atomic under the GIL,
+        so a still-valid token is returned without serializing the main
+        loop, connect thread, and health monitor on self._lock. The
+        lock is only taken (and the check repeated) when a refresh
+        actually looks necessary.
+        """
+        token = self._token
+        if token and (time.time() - self._token_acquired_at) < _TOKEN_REFRESH_S:
+            return token
+
         with self._lock:
+            # Re-check: another thread may have refreshed while we waited
             now = time.time()
             if self._token and (now - self._token_acquired_at) < _TOKEN_REFRESH_S:
                 return self._token
 
-            resp = requests.post(
+            resp = _http.post(
                 f"{BACKEND_URL}/api/auth/login",
                 json={"password": JARVIS_PASSWORD},
                 timeout=10,
@@ -317,21 +446,23 @@ class BackendClient:
             return self._token
 
     # ------------------------------------------------------------------
-    # Socket.IO event handlers (run in background thread)
+    # Socket.IO event handlers (run on the I/O loop)
     # ------------------------------------------------------------------
 
-    def _on_connect(self) -> None:
-        with self._lock:
-            self._connected = True
-            self._last_connected_at = time.time()
+    async def _on_connect(self) -> None:
+        # Single-word attribute stores are atomic under the GIL; no
+        # lock needed for the flag and timestamp
+        self._connected = True
+        self._last_connected_at = time.time()
 
         if self._reconnect_count > 0:
             logger.info(
                 "Reconnected to backend (attempt #%d)", self._reconnect_count
             )
-            # Refresh token on reconnection if it's old (>6 days)
+            # Refresh token on reconnection if it's old (>6 days); the
+            # blocking HTTP call runs in the executor, off the loop
             try:
-                self._get_token()
+                await self._loop.run_in_executor(None, self._get_token)
             except Exception as exc:
                 logger.warning("Token refresh on reconnect failed: %s", exc)
         else:
@@ -340,18 +471,17 @@ class BackendClient:
         self._reconnect_count += 1
 
     def _on_disconnect(self, reason: str = "") -> None:
-        with self._lock:
-            self._connected = False
-            self._last_disconnect_at = time.time()
+        self._connected = False
+        self._last_disconnect_at = time.time()
         logger.info("Disconnected from backend: %s", reason)
 
     def _on_connect_error(self, data: object = None) -> None:
-        with self._lock:
-            self._connected = False
+        self._connected = False
         logger.warning("Connection error: %s", data)
 
     def _on_listening(self, data: dict | None = None) -> None:
-        logger.debug("Backend listening for audio")
+        if logger.isEnabledFor(_DEBUG_LEVEL):
+            logger.debug("Backend listening for audio")
 
     def _on_processing(self, data: dict | None = None) -> None:
         logger.info("Backend processing audio (STT)")
@@ -375,11 +505,13 @@ class BackendClient:
             size = len(audio) if isinstance(audio, (str, bytes)) else 0
             logger.info("TTS chunk #%d received (%s, %d bytes)", idx, ct, size)
 
-            # Phase 36: route audio to speaker for playback
+            # Phase 36: route audio to speaker for playback (raw bytes
+            # from a binary Socket.IO frame; base64 str for legacy
+            # backends)
             if self._speaker is not None and audio and idx >= 0:
                 self._speaker.enqueue(
                     index=idx,
-                    audio_b64=audio,
+                    audio=audio,
                     content_type=data.get("contentType", "audio/wav"),
                 )
 
@@ -21,6 +21,10 @@ VAD_THRESHOLD = 0.15         # Lower than Silero default (0.5) because DMIC sign
                              # has heavy low-freq hum that reduces speech probability.
                              # High-pass filter in vad.py compensates, but peaks at ~0.3-0.9
                              # for speech vs <0.05 for quiet. 0.15 gives <5% false positives.
+VAD_ENERGY_GATE = 1e-6       # Mean-square energy gate (post-HPF, [-1,1] float domain).
+                             # Frames below this (~RMS 0.001, ~33 int16 counts) skip the
+                             # Silero model entirely -- quiet-room frames after the HPF sit
+                             # well under it, speech sits orders of magnitude above.
 
 # ALSA device configuration
 ALSA_DEVICE = "default"      # Uses the plug->dsnoop->hw:sofhdadsp,7 chain from /etc/asound.conf
@@ -40,7 +44,9 @@ BACKEND_PING_TIMEOUT_S = 120           # Stale connection warning threshold
 SPEAKER_SAMPLE_RATE = 48000      # Must match dmix slave rate in /etc/asound.conf
 SPEAKER_CHANNELS = 2             # Must match dmix slave channels (stereo)
 SPEAKER_PERIOD_SIZE = 1024       # Must match dmix period_size
+SPEAKER_PERIODS = 4              # Playback buffer = 4 periods (~85ms), fewer wake-ups than 2
 SPEAKER_DEVICE = "default"       # plug -> dmix -> hw:1,0 (HDA Analog via asound.conf)
+SPEAKER_CARD_INDEX = 1           # ALSA card for mixer controls (hw:1, HDA Analog)
 SPEAKER_VOLUME_PCT = 100         # Initial master volume percentage (100% for built-in speakers)
 
 # Mic mute during TTS playback (Phase 36 Plan 02)
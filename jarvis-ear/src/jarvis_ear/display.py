@@ -1,17 +1,19 @@
 """Non-blocking HTTP client for the Jarvis display daemon.
 
 Calls the display daemon's HTTP API to show/hide the Jarvis HUD
-on the Home node eDP-1 display (localhost:8766). All calls are
-fire-and-forget via daemon threads -- they never block the audio
-capture main loop.
+on the Home node eDP-1 display (localhost:8766). Calls are queued to a
+single persistent worker thread -- they never block the audio capture
+main loop, and no thread is spawned per HUD event.
 
 Phase 37 -- Display Control integration.
 """
 
 import logging
+import queue
 import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from jarvis_ear.config import DISPLAY_DAEMON_URL
 
@@ -21,25 +23,49 @@ logger = logging.getLogger("jarvis_ear.display")
 class DisplayClient:
     """Fire-and-forget HTTP client for the display daemon.
 
-    Every public method spawns a daemon thread to make the HTTP call,
-    so the caller (main audio loop) is never blocked. Exceptions in
-    the daemon thread are caught and logged at debug level -- display
-    control is non-critical and must never interfere with audio capture.
+    Every public method drops an (endpoint, payload) tuple onto a small
+    bounded queue consumed by one persistent daemon worker, so the
+    caller (main audio loop) pays a queue put instead of a thread spawn
+    per HUD event. The worker reuses one requests.Session, keeping the
+    TCP connection to the daemon alive across events. Exceptions in the
+    worker are caught and logged at debug level -- display control is
+    non-critical and must never interfere with audio capture.
     """
 
     def __init__(self) -> None:
         self._url = DISPLAY_DAEMON_URL
+        self._queue: queue.Queue[tuple[str, dict]] = queue.Queue(maxsize=16)
+        # Keep-alive session: all HUD endpoints share the daemon's one
+        # host, so a small pool keeps the connection warm and avoids a
+        # TCP handshake per event
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._thread = threading.Thread(
+            target=self._worker,
+            name="jarvis-ear-display",
+            daemon=True,
+        )
+        self._thread.start()
 
     def _fire(self, endpoint: str, payload: dict) -> None:
-        """Fire-and-forget HTTP POST to the display daemon.
+        """Queue a fire-and-forget HTTP POST to the display daemon.
 
-        Spawns a daemon thread that makes the request with a 2-second
-        timeout. All exceptions are caught and logged at debug level.
+        Drops the event if the queue is full (a backlog of 16 HUD
+        updates means the daemon is unreachable anyway).
         """
-
-        def _do_post() -> None:
+        try:
+            self._queue.put_nowait((endpoint, payload))
+        except queue.Full:
+            logger.debug("Display queue full, dropping event for %s", endpoint)
+
+    def _worker(self) -> None:
+        """Consume queued HUD events and POST them over one session."""
+        while True:
+            endpoint, payload = self._queue.get()
             try:
-                requests.post(
+                self._session.post(
                     f"{self._url}{endpoint}",
                     json=payload,
                     timeout=2,
@@ -47,9 +73,6 @@ class DisplayClient:
             except Exception as exc:
                 logger.debug("Display call to %s failed: %s", endpoint, exc)
 
-        t = threading.Thread(target=_do_post, daemon=True)
-        t.start()
-
     def on_wake_word(self) -> None:
         """Show the HUD in listening state on wake word detection."""
         logger.info("Display: showing HUD (listening)")
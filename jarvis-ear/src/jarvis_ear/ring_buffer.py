@@ -1,61 +1,247 @@
-"""Fixed-size ring buffer for pre-roll audio storage.
+"""Single-producer single-consumer ring buffer for capture frames.
 
-Stores the N most recent audio frames (bytes objects) for pre-roll
-buffering before wake word detection. Thread-safe for single-producer
-single-consumer use (ALSA capture thread writes, wake word reader drains).
+One structure serves both roles that used to need a RingBuffer (pre-roll)
+plus a queue.Queue (frame delivery): the ALSA capture thread pushes every
+frame into the ring, the main loop pops fresh frames from its own read
+index, and pre-roll is read as the last N frames behind the write index.
+
+Lock-free by construction: the producer only ever writes the head index
+and the consumer only ever writes the tail index, so under CPython's GIL
+no lock is needed on the per-frame path (the old design took two lock
+acquires plus a Condition wait every 32ms). The consumer blocks on a
+single threading.Event when the ring is empty.
 """
 
+import logging
 import threading
-from collections import deque
+from collections.abc import Iterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 class RingBuffer:
-    """Fixed-size ring buffer storing the N most recent audio frames.
+    """SPSC frame ring with overwrite-oldest and pre-roll readback.
 
-    Uses collections.deque(maxlen=N) internally for O(1) append with
-    automatic eviction of the oldest entry when full. A threading.Lock
-    ensures safety across Python implementations beyond CPython's GIL.
+    The producer (ALSA capture thread) calls push_frame() for every
+    frame and never blocks: when the consumer lags by a full ring, old
+    slots are simply overwritten and the consumer resynchronizes on its
+    next pop, counting the skipped frames as drops. The consumer (main
+    loop) calls get_frame() to pop frames in order and drain_preroll()
+    to read the most recent frames before a wake word.
     """
 
-    def __init__(self, max_frames: int) -> None:
-        """Initialize ring buffer with capacity for max_frames.
+    def __init__(
+        self, capacity_frames: int, preroll_frames: int, frame_bytes: int
+    ) -> None:
+        """Initialize the ring.
 
         Args:
-            max_frames: Maximum number of frames to store. When full,
-                        appending a new frame evicts the oldest.
+            capacity_frames: Total slots in the ring. Bounds how far the
+                consumer may lag before old frames are overwritten
+                (128 frames = ~4s at 32ms/frame).
+            preroll_frames: How many trailing frames drain_preroll()
+                returns. Must be well below capacity_frames so pre-roll
+                reads never race the producer's overwrites.
+            frame_bytes: Size of each frame in bytes; sizes the
+                contiguous backing buffer and the preallocated pre-roll
+                assembly buffer.
         """
-        self._buffer: deque[bytes] = deque(maxlen=max_frames)
-        self._lock = threading.Lock()
+        # One contiguous preallocated backing array: slot i lives at
+        # sample offset (i % capacity) * frame_samples. Backing is
+        # int16 (the wire sample format) so pops hand consumers an
+        # ndarray slice copy directly -- downstream VAD/wake word went
+        # through a bytes copy plus np.frombuffer per frame otherwise.
+        # The producer still copies raw bytes in through a flat uint8
+        # view of the same memory.
+        self._frame_samples = frame_bytes // 2
+        self._arr = np.empty(
+            capacity_frames * self._frame_samples, dtype=np.int16
+        )
+        self._buf_view = memoryview(self._arr.view(np.uint8))
+        self._capacity = capacity_frames
+        self._preroll_frames = preroll_frames
+        self._frame_bytes = frame_bytes
 
-    def append(self, frame: bytes) -> None:
-        """Add a frame, evicting the oldest if full.
+        # Preallocated assembly buffer for drain_preroll: frames are
+        # copied into place instead of joined from many small bytes
+        self._preroll_buf = bytearray(preroll_frames * frame_bytes)
+        self._preroll_view = memoryview(self._preroll_buf)
 
-        Args:
-            frame: Raw PCM audio frame as bytes.
+        # head: next write index (producer-only writes)
+        # tail: next read index (consumer-only writes)
+        # Both grow without bound; slot index is (i % capacity).
+        self._head = 0
+        self._tail = 0
+
+        # drain_preroll never reads frames older than this (set on each
+        # drain so consecutive wake words don't replay the same audio)
+        self._preroll_floor = 0
+
+        self._data_ready = threading.Event()
+        self._sentinel = False
+        self._drop_count = 0
+
+    @property
+    def drop_count(self) -> int:
+        """Total frames skipped because the consumer lagged a full ring."""
+        return self._drop_count
+
+    # ------------------------------------------------------------------
+    # Producer side (capture thread)
+    # ------------------------------------------------------------------
+
+    def push_frame(self, frame: bytes | memoryview) -> None:
+        """Publish a frame, overwriting the oldest slot if full.
+
+        Accepts any bytes-like of exactly frame_bytes; the data is
+        copied into the backing buffer before this returns, so the
+        caller may reuse its buffer immediately.
+
+        Never blocks: pre-roll must stay current even when the consumer
+        stalls, so a lagging consumer loses old frames rather than the
+        producer losing new ones.
+        """
+        head = self._head
+        off = (head % self._capacity) * self._frame_bytes
+        self._buf_view[off:off + self._frame_bytes] = frame
+        self._head = head + 1
+        self._data_ready.set()
+
+    def push_sentinel(self) -> None:
+        """Wake a consumer blocked in get_frame() with a one-shot None.
+
+        Used by signal handlers to unblock the main loop on shutdown.
         """
-        with self._lock:
-            self._buffer.append(frame)
+        self._sentinel = True
+        self._data_ready.set()
 
-    def drain(self) -> bytes:
-        """Return all buffered frames concatenated and clear the buffer.
+    # ------------------------------------------------------------------
+    # Consumer side (main loop)
+    # ------------------------------------------------------------------
+
+    def get_frame(self, timeout: float | None = None) -> np.ndarray | None:
+        """Pop the next frame in order, blocking while the ring is empty.
+
+        Args:
+            timeout: Maximum seconds to wait for a frame, or None to
+                block indefinitely.
 
         Returns:
-            All buffered frames joined as a single bytes object.
-            Returns empty bytes if buffer is empty.
+            The oldest unread frame as an int16 ndarray copy, or None
+            (timeout / sentinel).
         """
-        with self._lock:
-            if not self._buffer:
-                return b""
-            data = b"".join(self._buffer)
-            self._buffer.clear()
-            return data
-
-    def clear(self) -> None:
-        """Discard all buffered frames."""
-        with self._lock:
-            self._buffer.clear()
-
-    def __len__(self) -> int:
-        """Number of frames currently buffered."""
-        with self._lock:
-            return len(self._buffer)
+        while True:
+            frame = self._try_pop()
+            if frame is not None:
+                return frame
+            if self._sentinel:
+                self._sentinel = False
+                return None
+
+            # Clear-then-recheck so a push between the pop attempt and
+            # the wait cannot be missed
+            self._data_ready.clear()
+            frame = self._try_pop()
+            if frame is not None:
+                return frame
+            if self._sentinel:
+                self._sentinel = False
+                return None
+            if not self._data_ready.wait(timeout):
+                return None
+
+    def _try_pop(self) -> np.ndarray | None:
+        """Non-blocking pop; returns None if the ring is empty."""
+        head = self._head
+        tail = self._tail
+
+        # Producer lapped us: resynchronize with a slack margin of 8
+        # slots so the frame we return cannot be overwritten mid-read
+        if head - tail > self._capacity - 8:
+            skipped = head - self._capacity + 8 - tail
+            tail = head - self._capacity + 8
+            self._drop_count += skipped
+            logger.warning(
+                "Consumer lagged a full ring, skipped %d frames "
+                "(total drops: %d)",
+                skipped,
+                self._drop_count,
+            )
+
+        if tail == head:
+            return None
+
+        # Copy the slot out: consumers may hold frames well past one
+        # ring lap (e.g. the capture buffer), so they cannot share the
+        # backing storage. The 8-slot slack above keeps the producer
+        # from overwriting the slot mid-copy. The copy is already an
+        # int16 ndarray, so downstream skips bytes -> np.frombuffer.
+        ns = self._frame_samples
+        off = (tail % self._capacity) * ns
+        frame = self._arr[off:off + ns].copy()
+        self._tail = tail + 1
+        return frame
+
+    def iterframes(self) -> Iterator[memoryview]:
+        """Iterate the pre-roll span frame by frame, zero-copy.
+
+        Stream-oriented alternative to drain_preroll() for consumers
+        that process one frame at a time: yields one memoryview per
+        frame straight into the ring's backing buffer, so no
+        concatenated bytes object is ever materialized. Advances the
+        pre-roll floor exactly like drain_preroll().
+
+        The views stay valid until the producer laps the ring (several
+        seconds at 32ms/frame) -- consume them promptly and copy
+        anything kept beyond that.
+        """
+        head = self._head
+        start = max(self._preroll_floor, head - self._preroll_frames)
+        self._preroll_floor = head
+        return self._iterspan(start, head)
+
+    def _iterspan(self, start: int, stop: int) -> Iterator[memoryview]:
+        """Yield zero-copy frame views for ring indices [start, stop)."""
+        cap = self._capacity
+        fb = self._frame_bytes
+        buf = self._buf_view
+        for i in range(start, stop):
+            off = (i % cap) * fb
+            yield buf[off:off + fb]
+
+    def drain_preroll(self) -> bytes:
+        """Read the most recent pre-roll frames without consuming them.
+
+        Returns the last preroll_frames frames published before now,
+        concatenated, and raises the floor so the next drain cannot
+        replay the same audio. Returns empty bytes if nothing new has
+        been published since the last drain.
+        """
+        head = self._head
+        start = max(self._preroll_floor, head - self._preroll_frames)
+        self._preroll_floor = head
+        if start >= head:
+            return b""
+        fb = self._frame_bytes
+        buf = self._buf_view
+        view = self._preroll_view
+
+        # The drained frames occupy one contiguous byte range in the
+        # backing buffer, split at most once by the wrap point -- so the
+        # whole span moves in one or two large slice copies instead of
+        # a per-frame Python loop.
+        total = (head - start) * fb
+        cap_bytes = self._capacity * fb
+        first = (start % self._capacity) * fb
+        end = first + total
+        if end <= cap_bytes:
+            view[:total] = buf[first:end]
+        else:
+            split = cap_bytes - first
+            view[:split] = buf[first:]
+            view[split:total] = buf[:end - cap_bytes]
+        # One immutable copy of exactly the drained span; the assembly
+        # buffer itself is reused across drains
+        return bytes(view[:total])
@@ -1,9 +1,10 @@
 """AudioPlayer: Ordered TTS chunk playback through ALSA speakers.
 
-Receives base64-encoded TTS audio chunks from the backend, decodes them
-via ffmpeg to raw PCM (48kHz stereo S16LE), and writes to the ALSA dmix
-playback device.  Chunks are buffered and played in sequential index order
-to handle out-of-order delivery.
+Receives TTS audio chunks from the backend (raw bytes over binary
+Socket.IO frames, or legacy base64 strings), decodes them
+in-process via PyAV (libavcodec) to raw PCM (48kHz stereo S16LE), and
+writes to the ALSA dmix playback device.  Chunks are buffered and played
+in sequential index order to handle out-of-order delivery.
 
 Features (Phase 36 Plan 02):
 - Mic mute during playback to prevent echo/self-trigger
@@ -16,16 +17,20 @@ Phase 36 -- Speaker Output Loop.
 from __future__ import annotations
 
 import base64
+import heapq
+import io
+import itertools
 import logging
-import math
+import os
 import queue
-import struct
 import subprocess
 import threading
 import time
 from typing import Callable
 
 import alsaaudio
+import av
+import numpy as np
 
 from jarvis_ear.config import (
     CHIME_AMPLITUDE,
@@ -33,9 +38,11 @@ from jarvis_ear.config import (
     CHIME_GAP_DURATION_S,
     CHIME_TONE_DURATION_S,
     MIC_MUTE_SAFETY_TIMEOUT_S,
+    SPEAKER_CARD_INDEX,
     SPEAKER_CHANNELS,
     SPEAKER_DEVICE,
     SPEAKER_PERIOD_SIZE,
+    SPEAKER_PERIODS,
     SPEAKER_SAMPLE_RATE,
     SPEAKER_VOLUME_PCT,
 )
@@ -45,32 +52,63 @@ logger = logging.getLogger("jarvis_ear.speaker")
 # Bytes per ALSA period: period_size frames * channels * 2 bytes (S16LE)
 _PERIOD_BYTES = SPEAKER_PERIOD_SIZE * SPEAKER_CHANNELS * 2
 
+# One period of silence, allocated once; pad fills slice a zero-copy
+# view of this instead of building b"\x00" * n per short tail
+_PERIOD_SILENCE = memoryview(bytes(_PERIOD_BYTES))
+
+# Speaker-native raw PCM content type: chunks tagged with this are
+# already playable and skip the decoder entirely (see _decode_to_pcm)
+_RAW_PCM_TYPE = (
+    f"audio/pcm;rate={SPEAKER_SAMPLE_RATE}"
+    f";channels={SPEAKER_CHANNELS};format=s16le"
+)
+
+
+# Markers passed through the PCM pipeline queue (decoder -> writer)
+_UTTERANCE_DONE = object()
+_SHUTDOWN = object()
+
 
 class AudioPlayer:
     """Ordered TTS audio playback through ALSA speakers.
 
     Opens a single ALSA playback device at init and keeps it open for the
-    daemon's lifetime.  A background daemon thread consumes chunks from an
-    ordered priority queue, decodes via ffmpeg, and writes raw PCM to ALSA.
+    daemon's lifetime.  Playback is a two-stage pipeline of daemon
+    threads: a decoder consumes chunks from an ordered heap and decodes
+    them to PCM, a writer feeds the PCM to ALSA -- so chunk N+1 decodes
+    while chunk N is still playing.
 
     Mic mute/unmute ensures the DMIC is silenced during playback to prevent
     echo and spurious wake word detections.
     """
 
+    # Class-level chime cache: the chime depends only on module constants,
+    # so all AudioPlayer instances share one lazily-generated buffer
+    _CHIME_CACHE: bytes | None = None
+
     def __init__(
         self,
         on_playback_done: Callable[[], None] | None = None,
     ) -> None:
         self._on_playback_done = on_playback_done
-        self._queue: queue.PriorityQueue = queue.PriorityQueue()
-        self._playing = threading.Event()
+        # Min-heap of (index, tiebreaker, payload, content_type)
+        # guarded by a condition variable.  The monotonic tiebreaker
+        # guarantees tuple comparison stops at the integers -- a bare
+        # PriorityQueue would fall through to comparing the payloads
+        # (O(len) and a TypeError if two chunks share an index).
+        self._heap: list[tuple[int, int, bytes | str, str]] = []
+        self._cv = threading.Condition()
+        self._counter = itertools.count()
         self._stop_event = threading.Event()
 
         # Mic mute tracking
         self._mic_muted_at: float | None = None
 
-        # Pre-generate wake word chime PCM
-        self._chime_pcm: bytes = self._generate_chime()
+        # Reused pad buffer for the final short period of a PCM write
+        self._pad_buf = bytearray(_PERIOD_BYTES)
+
+        # Wake word chime PCM (shared, generated on first construction)
+        self._chime_pcm: bytes = self._get_chime()
 
         # Open ALSA playback device (kept open for daemon lifetime)
         self._pcm = alsaaudio.PCM(
@@ -81,6 +119,7 @@ class AudioPlayer:
             channels=SPEAKER_CHANNELS,
             format=alsaaudio.PCM_FORMAT_S16_LE,
             periodsize=SPEAKER_PERIOD_SIZE,
+            periods=SPEAKER_PERIODS,
         )
         logger.info(
             "ALSA playback device opened: %s @ %dHz, %dch, period=%d",
@@ -90,32 +129,64 @@ class AudioPlayer:
             SPEAKER_PERIOD_SIZE,
         )
 
+        # In-process mixer handles (card 1): replaces the amixer
+        # subprocess fork on every mute/unmute and at startup
+        self._speaker_mixer = self._open_mixer("Speaker")
+        self._master_mixer = self._open_mixer("Master")
+        self._dmic_mixer = self._open_mixer("Dmic0")
+
         # Enable built-in speakers (Speaker switch + Master)
         self._enable_speakers()
 
-        # Start background playback thread
+        # Decoded-PCM pipeline queue: bounds in-flight decoded audio
+        # to a few chunks while letting decode overlap playback
+        self._pcm_queue: queue.Queue = queue.Queue(maxsize=4)
+
+        # Start the pipeline threads (decoder feeds writer)
         self._thread = threading.Thread(
             target=self._playback_loop,
-            name="jarvis-ear-speaker",
+            name="jarvis-ear-decoder",
             daemon=True,
         )
         self._thread.start()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="jarvis-ear-speaker",
+            daemon=True,
+        )
+        self._writer_thread.start()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def enqueue(self, index: int, audio_b64: str, content_type: str) -> None:
+    def enqueue(self, index: int, audio: bytes | str, content_type: str) -> None:
         """Add a TTS chunk to the ordered playback queue.
 
+        The backend sends raw audio bytes in binary Socket.IO frames;
+        base64 strings are still accepted for backward compatibility
+        and decoded on the playback thread (the first consumer of the
+        bytes anyway), so the Socket.IO receive thread is never blocked
+        on a multi-hundred-KB decode.
+
         Args:
             index: Sequential chunk index (0-based).
-            audio_b64: Base64-encoded audio data.
+            audio: Raw audio bytes, or base64-encoded audio data.
             content_type: MIME type (e.g. "audio/wav", "audio/ogg").
         """
-        audio_bytes = base64.b64decode(audio_b64)
-        self._queue.put((index, audio_bytes, content_type))
-        logger.debug("Enqueued TTS chunk #%d (%d bytes, %s)", index, len(audio_bytes), content_type)
+        with self._cv:
+            heapq.heappush(
+                self._heap,
+                (index, next(self._counter), audio, content_type),
+            )
+            self._cv.notify()
+        logger.debug(
+            "Enqueued TTS chunk #%d (%d %s, %s)",
+            index,
+            len(audio),
+            "bytes" if isinstance(audio, bytes) else "b64 chars",
+            content_type,
+        )
 
     def signal_done(self, total_chunks: int) -> None:
         """Signal that all TTS chunks have been enqueued.
@@ -123,13 +194,23 @@ class AudioPlayer:
         Places a sentinel in the queue so the playback loop knows when
         playback is complete (after draining all real chunks).
         """
-        self._queue.put((total_chunks, b"", "sentinel"))
+        with self._cv:
+            heapq.heappush(
+                self._heap,
+                (total_chunks, next(self._counter), b"", "sentinel"),
+            )
+            self._cv.notify()
         logger.debug("Sentinel enqueued (total_chunks=%d)", total_chunks)
 
     @property
     def is_playing(self) -> bool:
-        """Whether audio is currently being played."""
-        return self._playing.is_set()
+        """Whether audio is currently being played.
+
+        Mic mute exactly bookends playback (set on the first chunk,
+        cleared at the sentinel), so the mute timestamp is the single
+        source of truth -- no separate Event to keep in lock-step.
+        """
+        return self._mic_muted_at is not None
 
     def play_chime(self) -> None:
         """Play the wake word detection chime synchronously.
@@ -149,7 +230,9 @@ class AudioPlayer:
         try:
             result = subprocess.run(
                 [
-                    "ffmpeg", "-y", "-i", path,
+                    "ffmpeg", "-y",
+                    "-hide_banner", "-nostdin", "-threads", "1",
+                    "-i", path,
                     "-ar", str(SPEAKER_SAMPLE_RATE),
                     "-ac", str(SPEAKER_CHANNELS),
                     "-f", "s16le",
@@ -158,6 +241,7 @@ class AudioPlayer:
                 ],
                 capture_output=True,
                 timeout=10,
+                bufsize=1 << 20,
             )
             if result.returncode != 0:
                 logger.warning("ffmpeg decode failed for %s: %s", path, result.stderr.decode()[:200])
@@ -175,12 +259,17 @@ class AudioPlayer:
         Ensures the mic is unmuted if it was muted during playback.
         """
         self._stop_event.set()
+        # Wake the playback thread immediately if it is waiting on the heap
+        with self._cv:
+            self._cv.notify_all()
 
         # Safety: guarantee mic is never left muted on shutdown
         if self._mic_muted_at is not None:
             self._unmute_mic()
 
         self._thread.join(timeout=2)
+        self._pcm_queue.put(_SHUTDOWN)
+        self._writer_thread.join(timeout=2)
 
         try:
             self._pcm.close()
@@ -193,18 +282,25 @@ class AudioPlayer:
     # Speaker enable
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _open_mixer(control: str) -> alsaaudio.Mixer | None:
+        """Open an ALSA mixer control, or None if unavailable."""
+        try:
+            return alsaaudio.Mixer(control, cardindex=SPEAKER_CARD_INDEX)
+        except alsaaudio.ALSAAudioError as exc:
+            logger.warning("Mixer control %s unavailable: %s", control, exc)
+            return None
+
     def _enable_speakers(self) -> None:
         """Turn on Speaker and Master switches at startup."""
-        cmds = [
-            ["amixer", "-c", "1", "sset", "Speaker", "on"],
-            ["amixer", "-c", "1", "sset", "Master", "on"],
-            ["amixer", "-c", "1", "sset", "Master", f"{SPEAKER_VOLUME_PCT}%"],
-        ]
-        for cmd in cmds:
-            try:
-                subprocess.run(cmd, capture_output=True, check=False)
-            except Exception as exc:
-                logger.warning("Failed to run %s: %s", " ".join(cmd), exc)
+        try:
+            if self._speaker_mixer is not None:
+                self._speaker_mixer.setmute(0)
+            if self._master_mixer is not None:
+                self._master_mixer.setmute(0)
+                self._master_mixer.setvolume(SPEAKER_VOLUME_PCT)
+        except alsaaudio.ALSAAudioError as exc:
+            logger.warning("Failed to enable speakers: %s", exc)
         logger.info(
             "Speakers enabled (Speaker=on, Master=on, volume=%d%%)",
             SPEAKER_VOLUME_PCT,
@@ -217,12 +313,9 @@ class AudioPlayer:
     def _mute_mic(self) -> None:
         """Mute the DMIC to prevent echo during TTS playback."""
         try:
-            subprocess.run(
-                ["amixer", "-c", "1", "sset", "Dmic0", "nocap"],
-                capture_output=True,
-                check=False,
-            )
-        except Exception as exc:
+            if self._dmic_mixer is not None:
+                self._dmic_mixer.setrec(0)
+        except alsaaudio.ALSAAudioError as exc:
             logger.warning("Failed to mute mic: %s", exc)
         self._mic_muted_at = time.monotonic()
         logger.info("Mic muted for playback")
@@ -230,12 +323,9 @@ class AudioPlayer:
     def _unmute_mic(self) -> None:
         """Unmute the DMIC after TTS playback completes."""
         try:
-            subprocess.run(
-                ["amixer", "-c", "1", "sset", "Dmic0", "cap"],
-                capture_output=True,
-                check=False,
-            )
-        except Exception as exc:
+            if self._dmic_mixer is not None:
+                self._dmic_mixer.setrec(1)
+        except alsaaudio.ALSAAudioError as exc:
             logger.warning("Failed to unmute mic: %s", exc)
         self._mic_muted_at = None
         logger.info("Mic unmuted")
@@ -244,6 +334,13 @@ class AudioPlayer:
     # Chime generation
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _get_chime(cls) -> bytes:
+        """Return the shared chime PCM, generating it on first use."""
+        if cls._CHIME_CACHE is None:
+            cls._CHIME_CACHE = cls._generate_chime()
+        return cls._CHIME_CACHE
+
     @staticmethod
     def _generate_chime() -> bytes:
         """Generate a two-tone ascending chime as raw PCM.
@@ -252,6 +349,10 @@ class AudioPlayer:
         each 150ms long with a 50ms silence gap.  Envelope applied to
         avoid clicks (25ms fade-in/out).
 
+        Synthesis is vectorized with NumPy: the per-sample time grid,
+        envelope, and sine are computed as whole arrays (~7200 samples
+        per tone) instead of a Python loop with per-sample struct.pack.
+
         Returns:
             Raw PCM bytes for the complete chime (~350ms).
         """
@@ -261,28 +362,25 @@ class AudioPlayer:
         gap_dur = CHIME_GAP_DURATION_S
         freqs = CHIME_FREQUENCIES
 
+        num_samples = int(rate * tone_dur)
+        t = np.arange(num_samples, dtype=np.float64) / rate
+        # Envelope: 25ms fade-in, 25ms fade-out
+        env = np.minimum(t * 40.0, 1.0) * np.minimum((tone_dur - t) * 40.0, 1.0)
+
+        gap_samples = int(rate * gap_dur)
+        gap = bytes(gap_samples * 2 * 2)  # stereo, 2 bytes/sample
+
         pcm_parts: list[bytes] = []
 
         for freq in freqs:
-            num_samples = int(rate * tone_dur)
-            tone_bytes = bytearray()
-            for i in range(num_samples):
-                t = i / rate
-                # Envelope: 25ms fade-in, 25ms fade-out
-                env = min(t * 40.0, 1.0) * min((tone_dur - t) * 40.0, 1.0)
-                val = int(amplitude * env * math.sin(2.0 * math.pi * freq * t))
-                # Clamp to int16 range
-                val = max(-32768, min(32767, val))
-                sample = struct.pack("<h", val)
-                # Duplicate for stereo (left + right)
-                tone_bytes.extend(sample)
-                tone_bytes.extend(sample)
-            pcm_parts.append(bytes(tone_bytes))
+            wave = amplitude * env * np.sin(2.0 * np.pi * freq * t)
+            mono = np.clip(wave, -32768, 32767).astype("<i2")
+            # Duplicate each sample for stereo (left + right)
+            pcm_parts.append(np.repeat(mono, 2).tobytes())
 
             # Add silence gap between tones (not after the last tone)
             if freq != freqs[-1]:
-                gap_samples = int(rate * gap_dur)
-                pcm_parts.append(b"\x00" * (gap_samples * 2 * 2))  # stereo, 2 bytes/sample
+                pcm_parts.append(gap)
 
         chime = b"".join(pcm_parts)
         logger.debug(
@@ -297,37 +395,94 @@ class AudioPlayer:
     # ------------------------------------------------------------------
 
     def _playback_loop(self) -> None:
-        """Consume chunks from the priority queue and play in order.
+        """Decoder stage: order chunks, decode, feed the writer.
 
-        Mutes the mic when the first chunk starts playing and unmutes
-        when playback completes (sentinel received).  A safety timeout
-        forces unmute if the mic stays muted longer than 60 seconds.
+        Mutes the mic when the first chunk arrives; the writer stage
+        unmutes once every chunk of the utterance has been played.  A
+        safety timeout forces unmute if the mic stays muted longer than
+        60 seconds.
         """
         next_index = 0
-        pending: dict[int, tuple[bytes, str]] = {}
+        pending: dict[int, tuple[bytes | str, str]] = {}
 
         while not self._stop_event.is_set():
             # Safety: force unmute if mic stuck muted too long
+            muted_at = self._mic_muted_at
             if (
-                self._mic_muted_at is not None
-                and time.monotonic() - self._mic_muted_at > MIC_MUTE_SAFETY_TIMEOUT_S
+                muted_at is not None
+                and time.monotonic() - muted_at > MIC_MUTE_SAFETY_TIMEOUT_S
             ):
                 logger.warning(
                     "Mic muted for >%.0fs -- force unmuting (safety timeout)",
                     MIC_MUTE_SAFETY_TIMEOUT_S,
                 )
                 self._unmute_mic()
-
-            # Block on queue with short timeout so we can check _stop_event
-            try:
-                item = self._queue.get(timeout=0.1)
-            except queue.Empty:
+                muted_at = None
+
+            # Event-driven wait: enqueue/signal_done/stop all notify the
+            # condition, so there is no fixed poll interval adding up to
+            # 100ms to the wake->chime path and no idle 10Hz wake-up.
+            # While the mic is muted, wait only until the safety
+            # deadline so the force-unmute above still fires.
+            if muted_at is not None:
+                wait_timeout = max(
+                    0.0,
+                    MIC_MUTE_SAFETY_TIMEOUT_S
+                    - (time.monotonic() - muted_at),
+                )
+            else:
+                wait_timeout = None
+            with self._cv:
+                if not self._cv.wait_for(
+                    lambda: bool(self._heap) or self._stop_event.is_set(),
+                    timeout=wait_timeout,
+                ):
+                    continue  # Safety deadline reached; recheck above
+                if self._stop_event.is_set():
+                    break
+                idx, _tie, payload, content_type = heapq.heappop(self._heap)
+
+            # Sentinel: every chunk is decoded; let the writer run the
+            # completion sequence once the last PCM has been played
+            if content_type == "sentinel":
+                next_index = 0
+                pending.clear()
+                self._pcm_queue.put(_UTTERANCE_DONE)
                 continue
 
-            idx, audio_bytes, content_type = item
+            # Buffer chunk (may be out of order, still undecoded)
+            pending[idx] = (payload, content_type)
 
-            # Sentinel: all chunks for this utterance have been played
-            if content_type == "sentinel":
+            # First chunk: mute mic (which also marks us as playing)
+            if idx == 0:
+                self._mute_mic()
+
+            # Decode all sequential chunks available and hand them to
+            # the writer (blocks only if the pipeline is 4 chunks deep)
+            while next_index in pending:
+                chunk_audio, chunk_ct = pending.pop(next_index)
+                # Legacy base64 decode deferred to here, off the
+                # receive thread; binary frames arrive as bytes already
+                if isinstance(chunk_audio, str):
+                    chunk_audio = base64.b64decode(chunk_audio)
+                pcm_data = self._decode_to_pcm(chunk_audio, chunk_ct)
+                if pcm_data:
+                    self._pcm_queue.put(pcm_data)
+                next_index += 1
+
+    def _writer_loop(self) -> None:
+        """Writer stage: pull decoded PCM and feed ALSA.
+
+        Runs the utterance-completion sequence (ALSA drain, mic unmute,
+        on_playback_done) when the decoder forwards the done marker --
+        i.e. strictly after the last chunk has been written.
+        """
+        self._boost_thread_priority()
+        while True:
+            item = self._pcm_queue.get()
+            if item is _SHUTDOWN:
+                break
+            if item is _UTTERANCE_DONE:
                 try:
                     self._pcm.drain()
                 except Exception as exc:
@@ -338,9 +493,6 @@ class AudioPlayer:
                     if self._mic_muted_at is not None:
                         self._unmute_mic()
                 finally:
-                    self._playing.clear()
-                    next_index = 0
-                    pending.clear()
                     logger.info("Playback complete, draining ALSA buffer")
                     if self._on_playback_done is not None:
                         try:
@@ -348,31 +500,92 @@ class AudioPlayer:
                         except Exception as exc:
                             logger.warning("on_playback_done callback error: %s", exc)
                 continue
+            self._write_pcm(item)
 
-            # Buffer chunk (may be out of order)
-            pending[idx] = (audio_bytes, content_type)
-
-            # First chunk: mute mic and set playing state
-            if idx == 0:
-                self._mute_mic()
-                self._playing.set()
-
-            # Play all sequential chunks available
-            while next_index in pending:
-                chunk_audio, chunk_ct = pending.pop(next_index)
-                pcm_data = self._decode_to_pcm(chunk_audio, chunk_ct)
-                if pcm_data:
-                    self._write_pcm(pcm_data)
-                next_index += 1
+    @staticmethod
+    def _boost_thread_priority() -> None:
+        """Raise the writer thread's scheduling priority, best effort.
+
+        ALSA underruns show up as audible clicks when the writer loses
+        the CPU to background load mid-utterance; a modest SCHED_FIFO
+        priority keeps it scheduled ahead of normal tasks without
+        oversizing the playback buffer. Needs CAP_SYS_NICE (or an
+        rtprio rlimit); falls back to a negative nice value, and runs
+        at default priority if neither is permitted.
+        """
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            logger.info("Playback writer running at SCHED_FIFO priority 10")
+            return
+        except (PermissionError, OSError) as exc:
+            logger.debug("SCHED_FIFO unavailable (%s), trying nice", exc)
+        try:
+            os.nice(-10)
+            logger.info("Playback writer running at nice -10")
+        except (PermissionError, OSError) as exc:
+            logger.debug("Renice unavailable (%s), default priority", exc)
 
     # ------------------------------------------------------------------
     # Audio decoding
     # ------------------------------------------------------------------
 
     def _decode_to_pcm(self, audio_bytes: bytes, content_type: str) -> bytes:
-        """Decode audio to raw PCM (48kHz stereo S16LE) via ffmpeg.
+        """Decode audio to raw PCM (48kHz stereo S16LE) in-process.
+
+        Uses PyAV (same libavcodec backend as ffmpeg) so decoding a TTS
+        chunk costs no fork+exec and no pipe copies -- the per-chunk
+        ffmpeg subprocess added tens of ms between wake word and first
+        audio.  Handles WAV, Opus, and any other format libavcodec
+        supports.  Falls back to the ffmpeg subprocess on PyAV errors;
+        returns empty bytes if both fail.
+
+        Chunks tagged with the speaker-native content type
+        ("audio/pcm;rate=48000;channels=2;format=s16le") are returned
+        as-is -- no decode at all.
+        """
+        if content_type == _RAW_PCM_TYPE:
+            return audio_bytes
+        try:
+            parts: list[bytes] = []
+            resampler: av.AudioResampler | None = None
+            native = False
+            with av.open(io.BytesIO(audio_bytes)) as container:
+                for frame in container.decode(audio=0):
+                    if not native and resampler is None:
+                        # Decide once, on the first frame: if the TTS
+                        # audio is already 48kHz stereo s16 the whole
+                        # libswresample pass is skipped
+                        if (
+                            frame.format.name == "s16"
+                            and frame.sample_rate == SPEAKER_SAMPLE_RATE
+                            and len(frame.layout.channels) == SPEAKER_CHANNELS
+                        ):
+                            native = True
+                        else:
+                            resampler = av.AudioResampler(
+                                format="s16",
+                                layout="stereo",
+                                rate=SPEAKER_SAMPLE_RATE,
+                            )
+                    if native:
+                        parts.append(bytes(frame.planes[0]))
+                    else:
+                        for out in resampler.resample(frame):
+                            parts.append(bytes(out.planes[0]))
+            if resampler is not None:
+                # Flush any samples buffered inside the resampler
+                for out in resampler.resample(None):
+                    parts.append(bytes(out.planes[0]))
+            return b"".join(parts)
+        except Exception as exc:
+            logger.warning(
+                "PyAV decode failed (%s), falling back to ffmpeg", exc
+            )
+            return self._decode_to_pcm_ffmpeg(audio_bytes, content_type)
+
+    def _decode_to_pcm_ffmpeg(self, audio_bytes: bytes, content_type: str) -> bytes:
+        """Fallback decode via an ffmpeg subprocess.
 
-        Handles WAV, Opus, and any other format ffmpeg supports.
         Returns empty bytes on decode failure.
         """
         try:
@@ -380,6 +593,9 @@ class AudioPlayer:
                 [
                     "ffmpeg",
                     "-hide_banner",
+                    # Single decode thread: TTS chunks are small and the
+                    # thread-pool spin-up costs more than it saves
+                    "-threads", "1",
                     "-loglevel", "error",
                     "-i", "pipe:0",
                     "-f", "s16le",
@@ -389,6 +605,9 @@ class AudioPlayer:
                 ],
                 input=audio_bytes,
                 capture_output=True,
+                # Wide pipe wrapper buffers: fewer read() syscalls while
+                # slurping the decoded PCM back
+                bufsize=1 << 20,
             )
             if result.returncode != 0:
                 logger.warning(
@@ -407,18 +626,27 @@ class AudioPlayer:
     # ------------------------------------------------------------------
 
     def _write_pcm(self, pcm_data: bytes) -> None:
-        """Write raw PCM to ALSA in period-sized chunks.
-
-        Pads the final chunk with silence (zeros) if shorter than a
-        full period to avoid ALSA underruns.
+        """Write raw PCM to ALSA in one call.
+
+        alsaaudio accepts any whole number of periods per write
+        (PCM_NORMAL mode blocks in C until the device consumes the
+        data), so the period-aligned body goes down in a single
+        Python->C transition.  A short tail is copied into a reused
+        pad buffer and zero-filled to a full period to avoid ALSA
+        underruns -- no copy of the whole chunk is ever made: the body
+        is written through a zero-copy memoryview slice.
         """
-        offset = 0
-        while offset < len(pcm_data):
-            chunk = pcm_data[offset : offset + _PERIOD_BYTES]
-            if len(chunk) < _PERIOD_BYTES:
-                chunk += b"\x00" * (_PERIOD_BYTES - len(chunk))
-            try:
-                self._pcm.write(chunk)
-            except Exception as exc:
-                logger.warning("ALSA write error: %s", exc)
-            offset += _PERIOD_BYTES
+        mv = memoryview(pcm_data)
+        n = len(mv)
+        body = n - (n % _PERIOD_BYTES)
+        try:
+            if body:
+                self._pcm.write(mv[:body])
+            if body < n:
+                tail = n - body
+                pad = self._pad_buf
+                pad[:tail] = mv[body:]
+                pad[tail:] = _PERIOD_SILENCE[tail:]
+                self._pcm.write(pad)
+        except Exception as exc:
+            logger.warning("ALSA write error: %s", exc)
@@ -22,10 +22,15 @@ import enum
 import logging
 import time
 
+import numpy as np
+
 from jarvis_ear.config import CONVERSATION_TIMEOUT_S, SILENCE_TIMEOUT_S
 
 logger = logging.getLogger("jarvis_ear.state_machine")
 
+# Conversation window as integer nanoseconds for the monotonic_ns compare
+_CONVERSATION_TIMEOUT_NS = int(CONVERSATION_TIMEOUT_S * 1e9)
+
 
 class State(enum.Enum):
     IDLE = "idle"
@@ -48,11 +53,19 @@ class CaptureStateMachine:
 
     def __init__(self, silence_timeout: float = SILENCE_TIMEOUT_S):
         self._state = State.IDLE
-        self._silence_timeout = silence_timeout
-        self._capture_buffer: list[bytes] = []
-        self._last_speech_time: float = 0.0
-        self._capture_start_time: float = 0.0
-        self._conversation_start: float = 0.0
+        # Deadlines are integer nanoseconds from time.monotonic_ns():
+        # one int compare per frame instead of float arithmetic, and no
+        # repeated clock reads within a single on_frame() call.
+        self._silence_timeout_ns = int(silence_timeout * 1e9)
+        # Captured audio accumulates in one bytearray: += appends the
+        # raw int16 frame bytes through the buffer protocol, and the
+        # bytearray's geometric over-allocation amortizes growth. The
+        # old list-of-ndarrays design paid a list append per frame plus
+        # an O(total) np.concatenate at finalize.
+        self._capture_buffer = bytearray()
+        self._last_speech_time_ns = 0
+        self._capture_start_ns = 0
+        self._conversation_start_ns = 0
 
     @property
     def state(self) -> State:
@@ -63,6 +76,7 @@ class CaptureStateMachine:
 
         Args:
             preroll: Pre-roll audio bytes (500ms before wake word).
+                Seeds the capture buffer ahead of the live frames.
         """
         if self._state != State.IDLE:
             logger.warning(
@@ -73,17 +87,16 @@ class CaptureStateMachine:
 
         logger.info(">>> WAKE WORD DETECTED -- transitioning IDLE -> CAPTURING")
         self._state = State.CAPTURING
-        self._capture_buffer = []
-        if preroll:
-            self._capture_buffer.append(preroll)
-        self._last_speech_time = time.monotonic()
-        self._capture_start_time = time.monotonic()
+        self._capture_buffer = bytearray(preroll)
+        now = time.monotonic_ns()
+        self._last_speech_time_ns = now
+        self._capture_start_ns = now
 
-    def on_frame(self, frame: bytes, is_speech: bool) -> bytes | None:
+    def on_frame(self, frame: np.ndarray, is_speech: bool) -> bytes | None:
         """Process a frame during CAPTURING state.
 
         Args:
-            frame: Raw PCM audio frame.
+            frame: Audio frame as an int16 numpy array.
             is_speech: Whether VAD classified this frame as speech.
 
         Returns:
@@ -95,27 +108,29 @@ class CaptureStateMachine:
             return None
 
         # Always append the frame (we want silence gaps in the audio too,
-        # for natural speech cadence)
-        self._capture_buffer.append(frame)
+        # for natural speech cadence). += copies the int16 samples in
+        # via the buffer protocol, no intermediate bytes object.
+        self._capture_buffer += frame
 
+        now = time.monotonic_ns()
         if is_speech:
-            self._last_speech_time = time.monotonic()
+            self._last_speech_time_ns = now
 
         # Check silence timeout
-        silence_duration = time.monotonic() - self._last_speech_time
-        if silence_duration >= self._silence_timeout:
+        silence_ns = now - self._last_speech_time_ns
+        if silence_ns >= self._silence_timeout_ns:
             # End of utterance detected
-            duration = time.monotonic() - self._capture_start_time
-            audio = b"".join(self._capture_buffer)
+            duration = (now - self._capture_start_ns) / 1e9
+            audio = bytes(self._capture_buffer)
             logger.info(
                 "<<< SILENCE TIMEOUT (%.1fs) -- transitioning CAPTURING -> IDLE "
                 "(captured %.1fs of audio, %d bytes)",
-                silence_duration,
+                silence_ns / 1e9,
                 duration,
                 len(audio),
             )
             self._state = State.IDLE
-            self._capture_buffer = []
+            self._capture_buffer = bytearray()
             return audio
 
         return None
@@ -141,7 +156,7 @@ class CaptureStateMachine:
             CONVERSATION_TIMEOUT_S,
         )
         self._state = State.CONVERSATION
-        self._conversation_start = time.monotonic()
+        self._conversation_start_ns = time.monotonic_ns()
 
     def check_conversation_timeout(self) -> bool:
         """Check if the conversation follow-up window has expired.
@@ -152,7 +167,8 @@ class CaptureStateMachine:
         if self._state != State.CONVERSATION:
             return False
 
-        if time.monotonic() - self._conversation_start >= CONVERSATION_TIMEOUT_S:
+        elapsed_ns = time.monotonic_ns() - self._conversation_start_ns
+        if elapsed_ns >= _CONVERSATION_TIMEOUT_NS:
             logger.info("Conversation window expired, returning to IDLE")
             self._state = State.IDLE
             return True
@@ -174,9 +190,10 @@ class CaptureStateMachine:
 
         logger.info("Follow-up speech detected in conversation mode")
         self._state = State.CAPTURING
-        self._capture_buffer = []
-        self._last_speech_time = time.monotonic()
-        self._capture_start_time = time.monotonic()
+        self._capture_buffer = bytearray()
+        now = time.monotonic_ns()
+        self._last_speech_time_ns = now
+        self._capture_start_ns = now
 
     # ------------------------------------------------------------------
     # Reset
@@ -187,5 +204,5 @@ class CaptureStateMachine:
         if self._state != State.IDLE:
             logger.info("Force reset from %s -> IDLE", self._state)
         self._state = State.IDLE
-        self._capture_buffer = []
-        self._conversation_start = 0.0
+        self._capture_buffer = bytearray()
+        self._conversation_start_ns = 0
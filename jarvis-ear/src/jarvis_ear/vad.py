@@ -6,21 +6,27 @@ Designed for the two-stage pipeline: VAD gates wake word to save CPU.
 Silero VAD expects 512 samples at 16kHz (32ms frames) for streaming mode.
 """
 
+import functools
 import logging
+import os
 from pathlib import Path
 
 import numpy as np
 import onnxruntime as ort
 
-from jarvis_ear.config import SAMPLE_RATE, FRAME_SIZE
+# scipy is deliberately not a hard dependency (the HPF below is
+# hand-rolled for exactly that reason), but when it happens to be
+# installed its C sosfilt routine replaces the per-sample Python loop.
+# Install scipy to opt in; nothing changes otherwise.
+try:
+    from scipy.signal import sosfilt
+except ImportError:  # pragma: no cover - depends on environment
+    sosfilt = None
 
-logger = logging.getLogger(__name__)
+from jarvis_ear.config import SAMPLE_RATE, FRAME_SIZE, VAD_ENERGY_GATE
 
-# Expected frame size in bytes (16-bit PCM = 2 bytes per sample)
-_EXPECTED_BYTES = FRAME_SIZE * 2  # 512 * 2 = 1024 bytes
+logger = logging.getLogger(__name__)
 
-# Default model path: <project_root>/models/silero_vad.onnx
-_DEFAULT_MODEL_PATH = Path(__file__).parent.parent.parent / "models" / "silero_vad.onnx"
 
 # High-pass filter cutoff for DMIC noise removal.
 # Intel HDA DMICs produce massive low-frequency hum (~80Hz) that drowns
@@ -28,6 +34,34 @@ _DEFAULT_MODEL_PATH = Path(__file__).parent.parent.parent / "models" / "silero_v
 # high-pass at 85Hz removes this while preserving speech (100Hz+).
 _HPF_CUTOFF_HZ = 85
 
+# int16 -> [-1.0, 1.0] normalization scale, applied inside the HPF
+# loop so conversion and filtering happen in one pass over the samples
+_INT16_SCALE = 1.0 / 32768.0
+
+# Energy gate as a sum-of-squares threshold over one 512-sample window
+# (mean-square gate * window length), so the per-frame check is a
+# single np.dot with no division
+_ENERGY_GATE_SUM = VAD_ENERGY_GATE * FRAME_SIZE
+
+
+@functools.lru_cache(maxsize=1)
+def _default_model_path() -> Path:
+    """Resolve the preferred model file under <project_root>/models.
+
+    Probes the offline-optimized variants first: the int8-quantized
+    model (scripts/quantize_vad.py), then the fixed-shape export
+    (scripts/freeze_vad_shape.py), then the stock fp32 file. Lazy and
+    cached so the filesystem probes -- which can stall on a network
+    mount -- run at most once per process, and never when the caller
+    supplies an explicit model path.
+    """
+    models_dir = Path(__file__).parent.parent.parent / "models"
+    for name in ("silero_vad_int8.onnx", "silero_vad_fixed.onnx"):
+        candidate = models_dir / name
+        if candidate.exists():
+            return candidate
+    return models_dir / "silero_vad.onnx"
+
 
 def _design_highpass(cutoff_hz: float, sample_rate: int) -> tuple:
     """Design a 2nd-order Butterworth high-pass filter (biquad coefficients).
@@ -53,6 +87,46 @@ def _design_highpass(cutoff_hz: float, sample_rate: int) -> tuple:
     return np.array([b0, b1, b2], dtype=np.float32), np.array([1.0, a1, a2], dtype=np.float32)
 
 
+# Loaded ONNX sessions keyed by resolved model path. The session holds
+# the optimized graph and weights -- immutable and thread-safe -- so
+# every VoiceActivityDetector for the same model shares one load (~30MB
+# and a graph-optimization pass each otherwise). Mutable per-detector
+# state (IOBinding, buffers) stays on the instances.
+_SESSION_CACHE: dict[str, ort.InferenceSession] = {}
+
+
+def _load_session(resolved: Path) -> ort.InferenceSession:
+    """Load (or reuse) the ONNX Runtime session for a model path."""
+    cached = _SESSION_CACHE.get(str(resolved))
+    if cached is not None:
+        return cached
+
+    # ONNX Runtime session with CPU execution provider
+    # Limit to 1 thread to avoid 150%+ CPU from default thread pool
+    opts = ort.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+    # Single-threaded sequential execution skips the parallel
+    # executor's task scheduling; full graph optimization fuses ops
+    # at load time (extended+layout transforms), which matters when
+    # the per-window compute is only ~576 samples
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Pin the memory plan explicitly (these are the defaults today, but
+    # they are load-bearing here): the arena plus precomputed memory
+    # pattern lets ORT reuse its intermediate tensors across the
+    # fixed-shape per-window runs instead of re-allocating them
+    opts.enable_cpu_mem_arena = True
+    opts.enable_mem_pattern = True
+    session = ort.InferenceSession(
+        str(resolved),
+        sess_options=opts,
+        providers=["CPUExecutionProvider"],
+    )
+    _SESSION_CACHE[str(resolved)] = session
+    return session
+
+
 class VoiceActivityDetector:
     """Silero VAD wrapper for per-frame speech detection.
 
@@ -62,8 +136,9 @@ class VoiceActivityDetector:
 
     Usage:
         vad = VoiceActivityDetector(threshold=0.5)
-        is_speech = vad.is_speech(frame_bytes)  # True/False
-        prob = vad.get_probability(frame_bytes)  # 0.0 - 1.0
+        # frame: int16 numpy array, 512 samples (mono, 16kHz)
+        is_speech = vad.is_speech(frame)  # True/False
+        prob = vad.get_probability(frame)  # 0.0 - 1.0
         vad.reset()  # Between utterances
     """
 
@@ -71,6 +146,8 @@ class VoiceActivityDetector:
         self,
         threshold: float = 0.5,
         model_path: str | None = None,
+        enable_hpf: bool = True,
+        cpu_affinity: int | None = None,
     ) -> None:
         """Initialize VAD with Silero ONNX model.
 
@@ -80,15 +157,29 @@ class VoiceActivityDetector:
                 Default 0.5 is Silero's recommendation.
                 Lower (0.3) = more sensitive (fewer missed detections).
                 Higher (0.7) = fewer false positives.
-            model_path: Path to silero_vad.onnx file. If None, uses
-                <project_root>/models/silero_vad.onnx.
+            model_path: Path to silero_vad.onnx file. If None, prefers
+                the offline-optimized variants in <project_root>/models
+                (silero_vad_int8.onnx, then silero_vad_fixed.onnx),
+                falling back to silero_vad.onnx.
+            enable_hpf: Apply the 85Hz high-pass filter before
+                inference. Required on the Intel HDA DMIC (its
+                low-frequency hum swamps speech energy); disable on
+                capture hardware that is already DC-clean to skip the
+                filter cost entirely.
+            cpu_affinity: Pin the calling thread (the one that will
+                run inference) to this core. With single-threaded ORT
+                the 512-sample working set fits in L1, but only if the
+                scheduler stops migrating the thread between cores.
+                Pinning VAD and wake word to the same core tends to
+                win -- they share the capture frames in cache. None
+                (default) leaves scheduling to the kernel.
 
         Raises:
             FileNotFoundError: If the ONNX model file does not exist.
             RuntimeError: If ONNX Runtime fails to load the model.
         """
         if model_path is None:
-            resolved = _DEFAULT_MODEL_PATH
+            resolved = _default_model_path()
         else:
             resolved = Path(model_path)
 
@@ -100,35 +191,64 @@ class VoiceActivityDetector:
                 "src/silero_vad/data/silero_vad.onnx"
             )
 
-        # ONNX Runtime session with CPU execution provider
-        # Limit to 1 thread to avoid 150%+ CPU from default thread pool
-        opts = ort.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-        self._session = ort.InferenceSession(
-            str(resolved),
-            sess_options=opts,
-            providers=["CPUExecutionProvider"],
-        )
+        self._session = _load_session(resolved)
         self._threshold = threshold
 
-        # Silero VAD hidden state: shape (2, 1, 128) float32
-        # Persists across frames for temporal context
-        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        if cpu_affinity is not None:
+            try:
+                os.sched_setaffinity(0, {cpu_affinity})
+                logger.info("Inference thread pinned to core %d", cpu_affinity)
+            except OSError as exc:
+                logger.warning(
+                    "Could not pin inference thread to core %d: %s",
+                    cpu_affinity,
+                    exc,
+                )
 
         # Context window: Silero VAD prepends 64 samples (at 16kHz) from
         # the previous frame to provide overlap context for the model.
-        # Without this, the model outputs near-zero probabilities.
+        # Without this, the model outputs near-zero probabilities. The
+        # context lives in the head of the preallocated input buffer.
         self._context_size = 64 if SAMPLE_RATE == 16000 else 32
-        self._context = np.zeros((1, self._context_size), dtype=np.float32)
 
         # Sample rate as int64 scalar (Silero model input)
         self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
 
+        # Fixed inference buffers, bound once through IOBinding: the
+        # input window (context + frame) is assembled in place, the
+        # recurrent state lives in a dedicated in/out pair, and the
+        # probability lands in a fixed (1, 1) array. run_with_iobinding
+        # then allocates no tensors and builds no feed dict per window.
+        self._input_buf = np.zeros(
+            (1, self._context_size + FRAME_SIZE), dtype=np.float32
+        )
+        self._state_in = np.zeros((2, 1, 128), dtype=np.float32)
+        self._state_out = np.empty((2, 1, 128), dtype=np.float32)
+        self._prob_out = np.empty((1, 1), dtype=np.float32)
+        self._io_binding = self._session.io_binding()
+        self._bind_io()
+
         # High-pass filter to remove DMIC low-frequency hum (~80Hz).
         # Without this, 93%+ of signal energy is sub-100Hz noise that
         # prevents Silero VAD from detecting speech.
-        self._hpf_b, self._hpf_a = _design_highpass(_HPF_CUTOFF_HZ, SAMPLE_RATE)
+        self._enable_hpf = enable_hpf
+        hpf_b, hpf_a = _design_highpass(_HPF_CUTOFF_HZ, SAMPLE_RATE)
+        # Unpacked once to plain Python floats: the filter loop reads
+        # these every batch and scalar attributes avoid re-boxing the
+        # np.float32 coefficients on each call
+        self._hpf_b0 = float(hpf_b[0])
+        self._hpf_b1 = float(hpf_b[1])
+        self._hpf_b2 = float(hpf_b[2])
+        self._hpf_a1 = float(hpf_a[1])
+        self._hpf_a2 = float(hpf_a[2])
+        if sosfilt is not None:
+            # Same biquad as one second-order section plus its DF2T
+            # state, for scipy's C filter routine
+            self._sos = np.array(
+                [[self._hpf_b0, self._hpf_b1, self._hpf_b2,
+                  1.0, self._hpf_a1, self._hpf_a2]]
+            )
+            self._hpf_zi = np.zeros((1, 2))
         # Direct Form II Transposed filter state
         self._hpf_w = np.zeros(2, dtype=np.float64)
 
@@ -140,6 +260,35 @@ class VoiceActivityDetector:
             FRAME_SIZE * 1000 // SAMPLE_RATE,
         )
 
+    def _bind_io(self) -> None:
+        """Bind the fixed inference buffers to the ONNX session.
+
+        All five tensors (input window, recurrent state in/out, sample
+        rate, probability output) keep stable addresses for the life of
+        the detector, so this runs once at construction.
+        """
+        io = self._io_binding
+        io.bind_input(
+            "input", "cpu", 0, np.float32,
+            self._input_buf.shape, self._input_buf.ctypes.data,
+        )
+        io.bind_input(
+            "state", "cpu", 0, np.float32,
+            self._state_in.shape, self._state_in.ctypes.data,
+        )
+        io.bind_input(
+            "sr", "cpu", 0, np.int64,
+            self._sr.shape, self._sr.ctypes.data,
+        )
+        io.bind_output(
+            "output", "cpu", 0, np.float32,
+            self._prob_out.shape, self._prob_out.ctypes.data,
+        )
+        io.bind_output(
+            "stateN", "cpu", 0, np.float32,
+            self._state_out.shape, self._state_out.ctypes.data,
+        )
+
     @property
     def threshold(self) -> float:
         """Current speech probability threshold."""
@@ -152,82 +301,154 @@ class VoiceActivityDetector:
             raise ValueError(f"Threshold must be in [0.0, 1.0], got {value}")
         self._threshold = value
 
-    def is_speech(self, frame: bytes) -> bool:
+    def is_speech(self, frame: np.ndarray) -> bool:
         """Classify a single audio frame as speech or silence.
 
         Args:
-            frame: Raw PCM bytes (16-bit signed little-endian, mono, 16kHz).
-                Must be exactly 512 samples = 1024 bytes.
+            frame: Frame as an int16 numpy array (mono, 16kHz).
+                Must be exactly 512 samples.
 
         Returns:
             True if speech probability >= threshold.
 
         Raises:
-            ValueError: If frame is not exactly 1024 bytes.
+            ValueError: If frame is not exactly 512 samples.
         """
         return self.get_probability(frame) >= self._threshold
 
-    def get_probability(self, frame: bytes) -> float:
+    def is_speech_batch(self, frames: list[np.ndarray]) -> list[bool]:
+        """Classify a batch of consecutive frames as speech or silence.
+
+        Amortizes the per-call Python overhead (int16->float conversion,
+        high-pass filtering) over the whole batch. The Silero model is
+        stateful and temporally sequential, so inference itself still
+        runs one 512-sample window at a time internally.
+
+        Args:
+            frames: Consecutive int16 frames, each exactly 512 samples.
+
+        Returns:
+            One bool per frame (True where P(speech) >= threshold).
+        """
+        return [p >= self._threshold for p in self.get_probabilities(frames)]
+
+    def get_probability(self, frame: np.ndarray) -> float:
         """Get raw speech probability for a frame.
 
         Useful for logging, debugging, or custom thresholding logic.
 
         Args:
-            frame: Raw PCM bytes (16-bit signed little-endian, mono, 16kHz).
-                Must be exactly 512 samples = 1024 bytes.
+            frame: Frame as an int16 numpy array (mono, 16kHz).
+                Must be exactly 512 samples.
 
         Returns:
             Float in [0.0, 1.0] representing speech probability.
 
         Raises:
-            ValueError: If frame is not exactly 1024 bytes.
+            ValueError: If frame is not exactly 512 samples.
         """
-        if len(frame) != _EXPECTED_BYTES:
+        return self.get_probabilities((frame,))[0]
+
+    def get_probabilities(self, frames) -> list[float]:
+        """Get speech probabilities for consecutive frames in one pass.
+
+        The int16->float32 conversion and high-pass filter run once over
+        the concatenated batch; the stateful Silero model then consumes
+        one 512-sample window per frame, carrying hidden state forward.
+
+        Args:
+            frames: Sequence of consecutive int16 frames (512 samples each).
+
+        Returns:
+            One float in [0.0, 1.0] per input frame.
+
+        Raises:
+            ValueError: If any frame is not exactly 512 samples.
+        """
+        if not len(frames):
+            return []
+        audio_int16 = frames[0] if len(frames) == 1 else np.concatenate(frames)
+        if audio_int16.size % FRAME_SIZE != 0:
             raise ValueError(
-                f"Frame must be exactly {_EXPECTED_BYTES} bytes "
-                f"({FRAME_SIZE} samples x 2 bytes), got {len(frame)} bytes"
+                f"Frames must each be exactly {FRAME_SIZE} samples, "
+                f"got {audio_int16.size} samples total"
             )
 
-        # Convert raw PCM int16 -> float32 normalized to [-1.0, 1.0]
-        audio_int16 = np.frombuffer(frame, dtype=np.int16)
-        audio_float32 = audio_int16.astype(np.float32) / 32768.0
-
-        # Apply high-pass filter (Direct Form II Transposed) to remove
-        # DMIC low-frequency hum. Without this, VAD cannot detect speech.
-        b, a = self._hpf_b, self._hpf_a
-        w0, w1 = self._hpf_w[0], self._hpf_w[1]
-        filtered = np.empty_like(audio_float32)
-        for i in range(len(audio_float32)):
-            x = float(audio_float32[i])
-            y = b[0] * x + w0
-            w0 = b[1] * x - a[1] * y + w1
-            w1 = b[2] * x - a[2] * y
-            filtered[i] = y
-        self._hpf_w[0] = w0
-        self._hpf_w[1] = w1
-
-        # Reshape to batch format: (1, num_samples)
-        audio_input = filtered.reshape(1, -1)
-
-        # Prepend context window (64 samples at 16kHz) from previous frame.
-        # Silero VAD requires this overlap for accurate detection.
-        audio_with_context = np.concatenate([self._context, audio_input], axis=1)
-
-        # Save last context_size samples for next frame
-        self._context = audio_input[:, -self._context_size:]
-
-        # Run ONNX inference
-        ort_inputs = {
-            "input": audio_with_context,
-            "state": self._state,
-            "sr": self._sr,
-        }
-        output, state_new = self._session.run(None, ort_inputs)
-
-        # Update hidden state for next frame (temporal context)
-        self._state = state_new
-
-        return float(output[0][0])
+        # Normalize int16 -> [-1.0, 1.0] and high-pass filter the batch;
+        # the HPF removes DMIC low-frequency hum, without which VAD
+        # cannot detect speech.
+        if not self._enable_hpf:
+            # Clean capture hardware: just normalize
+            filtered = np.multiply(
+                audio_int16, _INT16_SCALE, dtype=np.float32
+            )
+        elif sosfilt is not None:
+            # scipy path: normalize in one fused multiply, then the
+            # same biquad runs as a single C call with its DF2T state
+            # threaded through zi
+            audio_float32 = np.multiply(
+                audio_int16, _INT16_SCALE, dtype=np.float32
+            )
+            filtered, self._hpf_zi = sosfilt(
+                self._sos, audio_float32, zi=self._hpf_zi
+            )
+        else:
+            # Pure-Python path: the IIR recurrence is sequential and
+            # cannot vectorize, so the loop runs over plain Python
+            # scalars -- one bulk tolist() in, one bulk asarray() out,
+            # scale and coefficients hoisted to locals, normalization
+            # folded into the loop so no numpy temporary is built.
+            b0, b1, b2 = self._hpf_b0, self._hpf_b1, self._hpf_b2
+            a1, a2 = self._hpf_a1, self._hpf_a2
+            scale = _INT16_SCALE
+            w0, w1 = self._hpf_w[0], self._hpf_w[1]
+            samples = audio_int16.tolist()
+            for i, s in enumerate(samples):
+                x = s * scale
+                y = b0 * x + w0
+                w0 = b1 * x - a1 * y + w1
+                w1 = b2 * x - a2 * y
+                samples[i] = y
+            self._hpf_w[0] = w0
+            self._hpf_w[1] = w1
+            filtered = np.asarray(samples, dtype=np.float32)
+
+        probs: list[float] = []
+        ctx = self._context_size
+        input_row = self._input_buf[0]
+        run = self._session.run_with_iobinding
+        binding = self._io_binding
+        for offset in range(0, len(filtered), FRAME_SIZE):
+            window = filtered[offset:offset + FRAME_SIZE]
+
+            # Assemble the window in place behind the carried context
+            # (the buffer head already holds the previous frame's tail)
+            input_row[ctx:] = window
+
+            # Energy gate: a frame whose post-HPF sum of squares is
+            # below the floor cannot be speech, so skip the model run
+            # entirely. Context still carries forward so the next
+            # window sees the true signal tail; the recurrent state is
+            # left untouched, which is exactly its value after silence.
+            if float(np.dot(window, window)) < _ENERGY_GATE_SUM:
+                input_row[:ctx] = input_row[-ctx:]
+                probs.append(0.0)
+                continue
+
+            # Run through the pre-bound buffers: no feed dict, no
+            # output allocation, probability and new state land in the
+            # fixed arrays bound at construction
+            run(binding)
+
+            # Carry context and recurrent state into the next window.
+            # Copying the (2, 1, 128) state back into the bound input
+            # array is ~1KB and keeps all bindings static (no per-window
+            # rebind calls).
+            input_row[:ctx] = input_row[-ctx:]
+            np.copyto(self._state_in, self._state_out)
+            probs.append(float(self._prob_out[0, 0]))
+
+        return probs
 
     def reset(self) -> None:
         """Reset VAD internal state.
@@ -236,7 +457,9 @@ class VoiceActivityDetector:
         frames for temporal context. Call this between separate
         utterances to avoid state leakage.
         """
-        self._state = np.zeros((2, 1, 128), dtype=np.float32)
-        self._context = np.zeros((1, self._context_size), dtype=np.float32)
+        self._state_in[:] = 0.0
+        self._input_buf[0, :self._context_size] = 0.0
         self._hpf_w = np.zeros(2, dtype=np.float64)
+        if sosfilt is not None:
+            self._hpf_zi[:] = 0.0
         logger.debug("VAD state reset")
@@ -18,6 +18,12 @@ from openwakeword import Model as OwwModel
 
 logger = logging.getLogger(__name__)
 
+# Reset openWakeWord's internal mel/embedding buffers after this many
+# consecutive VAD-silent frames (~2s at 32ms/frame). The two-stage gate
+# stops feeding it audio during silence, so without a reset the stale
+# tail of the last speech burst lingers in its rolling buffers.
+_SILENT_RESET_FRAMES = 64
+
 
 class WakeWordDetector:
     """openWakeWord wrapper for 'hey_jarvis' wake word detection.
@@ -39,25 +45,26 @@ class WakeWordDetector:
         hey_jarvis_path = openwakeword.models["hey_jarvis"]["model_path"]
         self._model = OwwModel(wakeword_model_paths=[hey_jarvis_path])
         self._threshold = threshold
+        self._silent_streak = 0
         logger.info(
             "WakeWordDetector loaded: model=hey_jarvis, threshold=%.2f",
             threshold,
         )
 
-    def detect(self, frame: bytes) -> bool:
+    def detect(self, frame: np.ndarray) -> bool:
         """Process a single audio frame and check for wake word.
 
         Args:
-            frame: Raw PCM bytes (16-bit signed LE, mono, 16kHz).
-                   Should be 512 samples (1024 bytes) to match our frame size.
+            frame: Frame as an int16 numpy array (mono, 16kHz).
+                   Should be 512 samples to match our frame size.
                    openWakeWord internally handles frame buffering and only
                    produces predictions after accumulating ~1280 samples.
 
         Returns:
             True if "Hey Jarvis" was detected with confidence >= threshold.
         """
-        # Convert bytes to int16 numpy array
-        audio_int16 = np.frombuffer(frame, dtype=np.int16)
+        audio_int16 = frame
+        self._silent_streak = 0
 
         # predict() returns dict: {"hey_jarvis_v0.1": score}
         # The model name in the dict is derived from the ONNX filename
@@ -76,7 +83,57 @@ class WakeWordDetector:
 
         return False
 
+    def detect_batch(self, frames: list[np.ndarray]) -> bool:
+        """Process several frames in one predict() call.
+
+        openWakeWord buffers audio internally and produces predictions
+        every ~1280 samples, so feeding a concatenated batch is
+        equivalent to per-frame calls but crosses the Python->model
+        boundary once per batch instead of once per frame.
+
+        Args:
+            frames: Int16 frames (mono, 16kHz).
+
+        Returns:
+            True if "Hey Jarvis" was detected with confidence >= threshold.
+        """
+        if not frames:
+            return False
+        self._silent_streak = 0
+        audio_int16 = frames[0] if len(frames) == 1 else np.concatenate(frames)
+        predictions = self._model.predict(audio_int16)
+        for model_name, score in predictions.items():
+            if score >= self._threshold:
+                logger.debug(
+                    "Wake word '%s' score: %.3f (threshold: %.2f)",
+                    model_name,
+                    score,
+                    self._threshold,
+                )
+                return True
+        return False
+
+    def note_silence(self, frame_count: int) -> None:
+        """Record frames the VAD gate classified as silence.
+
+        The two-stage pipeline skips wake word inference on silent
+        frames, so openWakeWord's rolling mel/embedding buffers stop
+        advancing and keep the tail of whatever was last heard. After
+        a sustained silent streak this clears that state, so the next
+        speech burst is scored on fresh audio instead of a stale
+        window. Any detect call resets the streak.
+
+        Args:
+            frame_count: Number of consecutive silent frames skipped.
+        """
+        self._silent_streak += frame_count
+        if self._silent_streak >= _SILENT_RESET_FRAMES:
+            self._model.reset()
+            self._silent_streak = 0
+            logger.debug("Wake word buffers cleared after silent streak")
+
     def reset(self) -> None:
         """Reset detection state (call after a detection to avoid re-triggering)."""
         self._model.reset()
+        self._silent_streak = 0
         logger.debug("Wake word detector reset")